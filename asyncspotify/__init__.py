@@ -14,16 +14,23 @@ from .album import FullAlbum, SimpleAlbum
 from .artist import FullArtist, SimpleArtist
 from .audioanalysis import AudioAnalysis
 from .audiofeatures import AudioFeatures
+from .cache import ResponseCache
 from .client import Client
 from .device import Device
 from .exceptions import *
 from .http import Route
 from .image import Image
+from .loader import BatchLoader
 from .oauth import AuthorizationCodeFlow, ClientCredentialsFlow, EasyAuthorizationCodeFlow
 from .object import SpotifyObject
+from .offload import LagMonitor, Offloader
+from .pager import CursorBasedPaging, Pager, SearchPager
 from .playing import CurrentlyPlaying, CurrentlyPlayingContext
 from .playlist import FullPlaylist, SimplePlaylist
+from .ratelimit import RateLimiter
+from .retry import RetryBudget, RetryPolicy
 from .scope import Scope
+from .sync import JSONPlaylistStorage, PlaylistState, PlaylistStorage
 from .track import FullTrack, PlaylistTrack, SimpleTrack
 from .user import PrivateUser, PublicUser
 
@@ -1,11 +1,16 @@
 from datetime import datetime
 
-from .mixins import ArtistMixin, ExternalIDMixin, ExternalURLMixin, ImageMixin, TrackMixin
-from .object import SpotifyObject
+from .mixins import ArtistMixin, ExternalIDMixin, ExternalURLMixin, ImageMixin, TrackMixin, shared_markets
+from .object import SpotifyObject, copied_value
 from .track import SimpleTrack
 
 
 class _BaseAlbum(SpotifyObject, TrackMixin, ImageMixin, ExternalURLMixin, ArtistMixin):
+	__slots__ = (
+		'_TrackMixin__total', '_TrackMixin__loaded', 'tracks', 'track_count', 'images', 'external_urls', 'link',
+		'artists', 'album_group', 'album_type', 'available_markets', 'release_date_precision', 'release_date',
+	)
+
 	_type = 'album'
 	_track_class = SimpleTrack
 	__date_fmt = dict(year='%Y', month='%Y-%m', day='%Y-%m-%d')
@@ -14,26 +19,37 @@ class _BaseAlbum(SpotifyObject, TrackMixin, ImageMixin, ExternalURLMixin, Artist
 		super().__init__(client, data)
 
 		TrackMixin.__init__(self, data)
-		ImageMixin.__init__(self, data)
 		ExternalURLMixin.__init__(self, data)
-		ArtistMixin.__init__(self, data)
 
-		self.album_group = data.pop('album_group', None)  # can be None, though this is not specified in the API docs
-		self.album_type = data.pop('album_type')
-		self.available_markets = data.pop('available_markets', None)
+		self.album_group = data.get('album_group', None)  # can be None, though this is not specified in the API docs
+		self.album_type = data.get('album_type', None)
+		self.available_markets = shared_markets(data.get('available_markets', None))
+
+		self.release_date_precision = data.get('release_date_precision', None)
+
+	def _decode_release_date(self, data):
+		precision = data.get('release_date_precision', None)
+		release_date = data.get('release_date', None)
+
+		if precision is None:
+			return None
+
+		try:
+			return datetime.strptime(release_date, self.__date_fmt[precision])
+		except (TypeError, ValueError):
+			return None
 
-		self.release_date_precision = data.pop('release_date_precision')
+	async def full(self):
+		'''
+		Get the complete version of this album. Lookups made close together are batched if the client has a ``batch_window``.
 
-		if self.release_date_precision is None:
-			self.release_date = None
-		else:
-			try:
-				self.release_date = datetime.strptime(
-					data.pop('release_date'),
-					self.__date_fmt[self.release_date_precision]
-				)
-			except ValueError:
-				self.release_date = None
+		:return: :class:`FullAlbum`, itself if it already is one.
+		'''
+
+		if isinstance(self, FullAlbum):
+			return self
+
+		return await self._client.get_album(self.id)
 
 
 class SimpleAlbum(_BaseAlbum):
@@ -53,7 +69,7 @@ class SimpleAlbum(_BaseAlbum):
 		List of artists that appear on the album.
 	images: List[:class:`Image`]
 		List of associated images, such as album cover in different sizes.
-	track_count: int
+	track_count: int or None
 		The expected track count as advertised by the last paging object. ``is_filled()`` can return True even if fewer tracks than this exists in ``tracks``, since some fetched tracks from the API can be None for various reasons.
 	uri: str
 		Spotify URI of the album.
@@ -63,10 +79,10 @@ class SimpleAlbum(_BaseAlbum):
 		Plaintext string of object type: ``album``.
 	album_type:
 		Type of album, e.g. ``album``, ``single`` or ``compilation``.
-	available_markets: List[str] or None
+	available_markets: Tuple[str] or None
 		Markets where the album is available: ISO-3166-1_.
-	external_urls: dict
-		Dictionary that maps type to url.
+	external_urls: Mapping[str, str]
+		Read only mapping of type to url.
 	release_date: `datetime <https://docs.python.org/3/library/datetime.html#module-datetime>`_
 		Date (and maybe time) of album release.
 	release_date_precision: str
@@ -75,6 +91,8 @@ class SimpleAlbum(_BaseAlbum):
 		Type of album, e.g. ``album``, ``single``, ``compilation`` or ``appears_on``.
 	'''
 
+	__slots__ = ()
+
 
 class FullAlbum(_BaseAlbum, ExternalIDMixin):
 	'''
@@ -90,16 +108,18 @@ class FullAlbum(_BaseAlbum, ExternalIDMixin):
 		An indicator of the popularity of the album, 0 being least popular and 100 being the most.
 	copyrights: dict
 		List of copyright objects.
-	external_ids: dict
-		Dictionary of external IDs.
+	external_ids: Mapping[str, str]
+		Read only mapping of external IDs.
 	'''
 
+	__slots__ = ('external_ids', 'genres', 'label', 'popularity', 'copyrights')
+
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
 		ExternalIDMixin.__init__(self, data)
 
-		self.genres = data.pop('genres')
-		self.label = data.pop('label')
-		self.popularity = data.pop('popularity')
-		self.copyrights = data.pop('copyrights')
+		self.genres = copied_value(data.get('genres', None))
+		self.label = data.get('label', None)
+		self.popularity = data.get('popularity', None)
+		self.copyrights = copied_value(data.get('copyrights', None))
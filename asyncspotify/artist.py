@@ -1,8 +1,10 @@
 from .mixins import ExternalURLMixin, ImageMixin
-from .object import SpotifyObject
+from .object import SpotifyObject, copied_value
 
 
 class _BaseArtist(SpotifyObject, ExternalURLMixin):
+	__slots__ = ('external_urls', 'link')
+
 	_type = 'artist'
 
 	def __init__(self, client, data):
@@ -44,6 +46,18 @@ class _BaseArtist(SpotifyObject, ExternalURLMixin):
 			offset=offset
 		)
 
+	async def full(self):
+		'''
+		Get the complete version of this artist. Lookups made close together are batched if the client has a ``batch_window``.
+
+		:return: :class:`FullArtist`, itself if it already is one.
+		'''
+
+		if isinstance(self, FullArtist):
+			return self
+
+		return await self._client.get_artist(self.id)
+
 
 class SimpleArtist(_BaseArtist):
 	'''
@@ -57,10 +71,12 @@ class SimpleArtist(_BaseArtist):
 		Spotify URI of the artist.
 	link: str
 		Spotify URL of the artist.
-	external_urls: dict
-		Dictionary that maps type to url.
+	external_urls: Mapping[str, str]
+		Read only mapping of type to url.
 	'''
 
+	__slots__ = ()
+
 
 class FullArtist(_BaseArtist, ImageMixin):
 	'''
@@ -78,11 +94,12 @@ class FullArtist(_BaseArtist, ImageMixin):
 		List of associated images.
 	'''
 
+	__slots__ = ('images', 'follower_count', 'genres', 'popularity')
+
 	def __init__(self, client, data):
 		super().__init__(client, data)
-		
-		ImageMixin.__init__(self, data)
 
-		self.follower_count = data['followers']['total']
-		self.genres = data.pop('genres')
-		self.popularity = data.pop('popularity')
+		followers = data.get('followers', None)
+		self.follower_count = None if followers is None else followers['total']
+		self.genres = copied_value(data.get('genres', None))
+		self.popularity = data.get('popularity', None)
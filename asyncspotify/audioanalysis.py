@@ -1,7 +1,7 @@
 from collections import namedtuple
 from datetime import timedelta
 
-from .object import SpotifyObject
+from .object import SpotifyObject, copied_value
 
 TimeInterval = namedtuple('TimeInterval', ('start', 'duration', 'confidence'))
 
@@ -56,60 +56,64 @@ class AudioAnalysis(SpotifyObject):
 		The time intervals of tatums throughout the track. A tatum represents the lowest regular pulse train that a listener intuitively infers from the timing of perceived musical events (segments).
 	'''
 
+	__slots__ = ('bars', 'beats', 'tatums', 'sections', 'segments', 'track')
+
 	_type = 'audio_analysis'
 
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
 		self.bars = [
-			TimeInterval(
-				start=timedelta(seconds=bar.pop('start')),
-				duration=timedelta(seconds=bar.pop('duration')),
-				**bar
-			) for bar in data.pop('bars')
+			TimeInterval(**dict(
+				bar,
+				start=timedelta(seconds=bar['start']),
+				duration=timedelta(seconds=bar['duration']),
+			)) for bar in data['bars']
 		]
 
 		self.beats = [
-			TimeInterval(
-				start=timedelta(seconds=beat.pop('start')),
-				duration=timedelta(seconds=beat.pop('duration')),
-				**beat
-			) for beat in data.pop('beats')
+			TimeInterval(**dict(
+				beat,
+				start=timedelta(seconds=beat['start']),
+				duration=timedelta(seconds=beat['duration']),
+			)) for beat in data['beats']
 		]
 
 		self.tatums = [
-			TimeInterval(
-				start=timedelta(seconds=tatum.pop('start')),
-				duration=timedelta(seconds=tatum.pop('duration')),
-				**tatum
-			) for tatum in data.pop('tatums')
+			TimeInterval(**dict(
+				tatum,
+				start=timedelta(seconds=tatum['start']),
+				duration=timedelta(seconds=tatum['duration']),
+			)) for tatum in data['tatums']
 		]
 
 		self.sections = [
-			Section(
-				start=timedelta(seconds=section.pop('start')),
-				duration=timedelta(seconds=section.pop('duration')),
-				**section
-			) for section in data.pop('sections')
+			Section(**dict(
+				section,
+				start=timedelta(seconds=section['start']),
+				duration=timedelta(seconds=section['duration']),
+			)) for section in data['sections']
 		]
 
 		self.segments = [
-			Segment(
-				start=timedelta(seconds=segment.pop('start')),
-				duration=timedelta(seconds=segment.pop('duration')),
-				loudness_max_time=timedelta(seconds=segment.pop('loudness_max_time')),
-				loudness_end=segment.pop('loudness_end', None),  # can be None, apparently
-				**segment
-			) for segment in data.pop('segments')
+			Segment(**dict(
+				segment,
+				start=timedelta(seconds=segment['start']),
+				duration=timedelta(seconds=segment['duration']),
+				loudness_max_time=timedelta(seconds=segment['loudness_max_time']),
+				loudness_end=segment.get('loudness_end', None),  # can be None, apparently
+				pitches=tuple(segment['pitches']),
+				timbre=tuple(segment['timbre']),
+			)) for segment in data['segments']
 		]
 
-		track_data = data.pop('track')
+		track_data = data['track']
 
-		self.track = Track(
-			duration=timedelta(seconds=track_data.pop('duration')),
-			offset_seconds=timedelta(seconds=track_data.pop('offset_seconds')),
-			window_seconds=timedelta(seconds=track_data.pop('window_seconds')),
-			end_of_fade_in=timedelta(seconds=track_data.pop('end_of_fade_in')),
-			start_of_fade_out=timedelta(seconds=track_data.pop('start_of_fade_out')),
-			**track_data
-		)
+		self.track = Track(**dict(
+			copied_value(track_data),
+			duration=timedelta(seconds=track_data['duration']),
+			offset_seconds=timedelta(seconds=track_data['offset_seconds']),
+			window_seconds=timedelta(seconds=track_data['window_seconds']),
+			end_of_fade_in=timedelta(seconds=track_data['end_of_fade_in']),
+			start_of_fade_out=timedelta(seconds=track_data['start_of_fade_out']),
+		))
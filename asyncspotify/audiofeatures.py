@@ -43,23 +43,28 @@ class AudioFeatures(SpotifyObject):
 		The overall estimated tempo of a track in beats per minute (BPM).
 	'''
 
+	__slots__ = (
+		'acousticness', 'analysis_url', 'danceability', 'duration', 'energy', 'instrumentalness', 'key', 'liveness',
+		'loudness', 'mode', 'speechiness', 'tempo', 'time_signature', 'track_href', 'valence',
+	)
+
 	_type = 'audio_features'
 
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
-		self.acousticness = data.pop('acousticness')
-		self.analysis_url = data.pop('analysis_url')
-		self.danceability = data.pop('danceability')
-		self.duration = timedelta(milliseconds=data.pop('duration_ms'))
-		self.energy = data.pop('energy')
-		self.instrumentalness = data.pop('instrumentalness')
-		self.key = data.pop('key')
-		self.liveness = data.pop('liveness')
-		self.loudness = data.pop('loudness')
-		self.mode = data.pop('mode')
-		self.speechiness = data.pop('speechiness')
-		self.tempo = data.pop('tempo')
-		self.time_signature = data.pop('time_signature')
-		self.track_href = data.pop('track_href')
-		self.valence = data.pop('valence')
+		self.acousticness = data['acousticness']
+		self.analysis_url = data['analysis_url']
+		self.danceability = data['danceability']
+		self.duration = timedelta(milliseconds=data['duration_ms'])
+		self.energy = data['energy']
+		self.instrumentalness = data['instrumentalness']
+		self.key = data['key']
+		self.liveness = data['liveness']
+		self.loudness = data['loudness']
+		self.mode = data['mode']
+		self.speechiness = data['speechiness']
+		self.tempo = data['tempo']
+		self.time_signature = data['time_signature']
+		self.track_href = data['track_href']
+		self.valence = data['valence']
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+
+from .utils import subslice
+
+log = logging.getLogger(__name__)
+
+# the most ids each "several items" endpoint takes in one request
+BATCH_LIMITS = {
+	'tracks': 50,
+	'albums': 20,
+	'artists': 50,
+	'audio-features': 100,
+}
+
+DEFAULT_BATCH_LIMIT = 20
+
+
+def batch_limit(path):
+	'''How many ids the endpoint at ``path`` takes in one request.'''
+
+	return BATCH_LIMITS.get(path, DEFAULT_BATCH_LIMIT)
+
+
+def split_ids(ids):
+	'''Flatten ``ids``, where each can also be a comma separated list of ids.'''
+
+	for id in ids:
+		if isinstance(id, str) and ',' in id:
+			yield from filter(None, id.split(','))
+		else:
+			yield id
+
+
+async def fetch_several(fetch, path, ids, **params):
+	'''
+	Fetch every id in ``ids`` from the several items endpoint at ``path``.
+
+	``fetch`` is called with a comma separated chunk of ids and ``params`` and returns the response. Duplicate ids are
+	only asked for once and all chunks are requested at the same time.
+
+	:return: Dict of every requested id to its object, or None if Spotify had nothing for it.
+	'''
+
+	unique = list(dict.fromkeys(ids))
+
+	if not unique:
+		return {}
+
+	key = path.replace('-', '_')
+	chunks = list(subslice(unique, batch_limit(path)))
+
+	log.debug('Fetching %s %s in %s requests', len(unique), path, len(chunks))
+
+	responses = await asyncio.gather(*(fetch(','.join(chunk), **params) for chunk in chunks))
+
+	found = dict.fromkeys(unique)
+
+	# objects come back in the order their ids were asked for, relinked tracks can have a different id
+	for chunk, data in zip(chunks, responses):
+		found.update(zip(chunk, data[key]))
+
+	return found
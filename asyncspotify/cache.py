@@ -0,0 +1,182 @@
+import logging
+from collections import OrderedDict
+from time import monotonic
+
+log = logging.getLogger(__name__)
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# first matching pattern wins, a ttl of None means the route is never cached
+# and a ttl of 0 means responses are only kept to be revalidated using their ETag
+DEFAULT_POLICIES = (
+	('me/player/devices', 5.0),
+	('me/player*', None),
+	('me', 0.0),
+	('me/*', None),
+	('playlists*', 0.0),
+	('tracks*', DAY),
+	('albums*', DAY),
+	('artists/*/top-tracks', HOUR),
+	('artists*', DAY),
+	('audio-features*', 7 * DAY),
+	('audio-analysis*', 7 * DAY),
+	('search', 5 * MINUTE),
+	('users/*', MINUTE),
+)
+
+
+class _CacheEntry:
+	__slots__ = ('payload', 'size', 'expires', 'etag', 'response', 'error')
+
+	def __init__(self, payload, size, expires, etag=None, response=None, error=None):
+		self.payload = payload
+		self.size = size
+		self.expires = expires
+		self.etag = etag
+		self.response = response
+		self.error = error
+
+	@property
+	def fresh(self):
+		return self.expires > monotonic()
+
+
+class ResponseCache:
+	'''
+	In-memory cache of GET responses, evicting the least recently used responses once ``max_size`` bytes is exceeded.
+
+	How long a response is kept is decided by ``policies``, a sequence of ``(pattern, ttl)`` pairs matched against
+	the route path (e.g. ``albums/*/tracks``). The first matching pattern wins, and routes that do not match any
+	pattern or match one with a ttl of ``None`` are never cached. By default catalog objects are kept for a long
+	time, devices for a few seconds and the player and other ``me/*`` endpoints are never cached.
+
+	Responses carrying an ``ETag`` are kept after they expire. The next request for them is sent with
+	``If-None-Match``, and a ``304 Not Modified`` answer reuses the stored response. Routes with a ttl of ``0``
+	are always revalidated this way, which by default is the case for playlists.
+
+	404 responses from cacheable routes are cached for ``negative_ttl`` seconds.
+
+	Responses are kept decoded and every hit is handed the same payload instead of a copy. Objects built from it never
+	modify it and only hand out read only views or copies of it, so changing an object doesn't change the cached
+	response. Raw responses requested through ``client.http`` are that same payload and must not be modified.
+
+	hits: int
+		Lookups answered from the cache, including revalidated responses.
+	misses: int
+		Lookups that had to go to the network for a full response.
+	revalidations: int
+		Stale responses that were confirmed unchanged by a ``304 Not Modified``.
+	evictions: int
+		Entries dropped to stay below ``max_size``.
+	'''
+
+	def __init__(self, max_size=32 * 1024 * 1024, policies=DEFAULT_POLICIES, negative_ttl=MINUTE):
+		self.max_size = max_size
+		self.policies = tuple(policies)
+		self.negative_ttl = negative_ttl
+
+		self.size = 0
+		self.hits = 0
+		self.misses = 0
+		self.revalidations = 0
+		self.evictions = 0
+
+		self._entries = OrderedDict()
+
+	def __repr__(self):
+		return '<ResponseCache entries={0} size={1} hits={2} misses={3} evictions={4}>'.format(
+			len(self), self.size, self.hits, self.misses, self.evictions
+		)
+
+	def __len__(self):
+		return len(self._entries)
+
+	def ttl(self, route):
+		'''How long responses from ``route`` should be cached, or ``None`` if they should not be.'''
+
+		for pattern, ttl in self.policies:
+			if route.matches(pattern):
+				return ttl
+		return None
+
+	def get(self, key):
+		'''
+		Get the entry for ``key``, or ``None`` on a miss.
+
+		The entry might be stale if it has an ETag, in which case it has to be revalidated before it is used.
+		'''
+
+		entry = self._entries.get(key)
+
+		if entry is not None and not entry.fresh and entry.etag is None:
+			self._remove(key)
+			entry = None
+
+		if entry is None or not entry.fresh:
+			self.misses += 1
+			return entry
+
+		self._entries.move_to_end(key)
+		self.hits += 1
+		return entry
+
+	def revalidated(self, key, ttl):
+		'''Mark a stale entry as still valid for another ``ttl`` seconds. Returns the entry, or ``None`` if it was evicted.'''
+
+		entry = self._entries.get(key)
+
+		if entry is None:
+			return None
+
+		entry.expires = monotonic() + ttl
+		self._entries.move_to_end(key)
+
+		self.misses -= 1
+		self.hits += 1
+		self.revalidations += 1
+		return entry
+
+	def set(self, key, payload, ttl, etag=None, size=None):
+		'''
+		Store a decoded response for ``ttl`` seconds, and for revalidation afterwards if it has an ``etag``.
+
+		``size`` is the size of the response body in bytes, which is what counts against ``max_size``.
+		'''
+
+		if ttl <= 0 and etag is None:
+			return
+
+		self._store(key, _CacheEntry(payload, len(payload) if size is None else size, monotonic() + ttl, etag))
+
+	def set_missing(self, key, response, error):
+		'''Remember that ``key`` responded with 404 Not Found.'''
+
+		if self.negative_ttl:
+			self._store(key, _CacheEntry(None, 0, monotonic() + self.negative_ttl, response=response, error=error))
+
+	def clear(self):
+		'''Drop every entry.'''
+
+		self._entries.clear()
+		self.size = 0
+
+	def _store(self, key, entry):
+		if entry.size > self.max_size:
+			return
+
+		if key in self._entries:
+			self._remove(key)
+
+		self._entries[key] = entry
+		self.size += entry.size
+
+		while self.size > self.max_size:
+			old_key, _ = next(iter(self._entries.items()))
+			self._remove(old_key)
+			self.evictions += 1
+
+	def _remove(self, key):
+		entry = self._entries.pop(key)
+		self.size -= entry.size
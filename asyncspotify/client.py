@@ -1,18 +1,23 @@
+import asyncio
 import logging
 from datetime import timedelta
+from functools import partial
 from typing import List
 
 from .album import FullAlbum, SimpleAlbum
 from .artist import FullArtist, SimpleArtist
 from .audioanalysis import AudioAnalysis
 from .audiofeatures import AudioFeatures
+from .bulk import fetch_several, split_ids
 from .device import Device
-from .http import HTTP
+from .http import HTTP, Route
+from .loader import BatchLoader
 from .oauth.flows import Authenticator, RefreshableFlowMixin
 from .object import SpotifyObject
-from .pager import CursorBasedPaging, Pager, SearchPager
+from .pager import CursorBasedPaging, Pager, SearchPager, empty_page, first_page_limit, paging_fields
 from .playing import CurrentlyPlaying, CurrentlyPlayingContext
 from .playlist import FullPlaylist, SimplePlaylist
+from .sync import PlaylistState, item_key
 from .track import FullTrack, PlaylistTrack, SimpleTrack
 from .user import PrivateUser, PublicUser
 from .utils import subslice
@@ -27,8 +32,45 @@ def get_id(obj):
 		return obj
 
 
-def clamp(limit, minimum):
-	return None if limit is None else min(max(limit, 1), minimum)
+def hydrate_path(obj):
+	'''The several items endpoint the complete version of ``obj`` is at, or None if it has none.'''
+
+	if getattr(obj, 'id', None) is None:
+		return None
+
+	for cls, path in ((SimpleTrack, 'tracks'), (SimpleAlbum, 'albums'), (SimpleArtist, 'artists')):
+		if isinstance(obj, cls):
+			return path
+
+	return None
+
+
+def build_models(cls, client, items):
+	'''Build a page of items into models. Missing items stay None.'''
+
+	return [None if item is None else cls(client, item) for item in items]
+
+
+async def collect(pager):
+	'''Gather every item of a pager into a list, a page at a time.'''
+
+	items = []
+
+	async for page in pager.pages():
+		items.extend(page)
+
+	return items
+
+
+async def stream(pager):
+	'''Yield every item of a pager as its page arrives, without holding on to earlier pages.'''
+
+	# reading every page ahead at once would hold the whole collection in memory
+	pager.parallel = False
+
+	async for page in pager.pages():
+		for item in page:
+			yield item
 
 
 class Client:
@@ -39,20 +81,54 @@ class Client:
 
 	auth: :class:`Authenticator`
 		Authenticator instance used for authenticating with the API.
+	loader: Optional[:class:`BatchLoader`]
+		Batches single object lookups, if ``batch_window`` was set.
 	'''
 
 	auth: Authenticator
 	http: HTTP
 
-	def __init__(self, auth):
+	def __init__(
+		self, auth, max_concurrency=10, route_limits=None, retry_policy=None,
+		coalesce=True, cache=None, decoder=None, executor=None, offload_threshold=256 * 1024, lag_limit=0.1,
+		prefetch=1, parallel_paging=True, batch_window=None, lazy=False
+	):
 		'''
 		Creates a Spotify Client instance.
 
 		:param auth: Instance of :class:`Authenticator`
-		'''
-
+		:param int max_concurrency: Maximum amount of requests in flight at the same time.
+		:param dict route_limits: Optional mapping of route patterns (e.g. ``playlists/*/tracks``) to a lower in-flight limit for those routes.
+		:param retry_policy: :class:`RetryPolicy` deciding how failed requests are retried.
+		:param bool coalesce: Whether identical GET requests issued at the same time should share a single request.
+		:param cache: Optional :class:`ResponseCache` to cache responses in.
+		:param decoder: Callable decoding JSON response bodies from bytes. Defaults to orjson or msgspec if installed, otherwise the standard library.
+		:param executor: Optional thread or process pool to decode large responses in. Thread pools also build the models of large responses.
+		:param int offload_threshold: Size in bytes from which responses are handled in ``executor``.
+		:param float lag_limit: Seconds parsing may block the event loop before a warning is logged.
+		:param int prefetch: How many pages ahead paged results are fetched in the background while iterating.
+		:param bool parallel_paging: Whether methods returning every item of a paged result fetch all pages concurrently.
+		:param float batch_window: If set, single track, artist and album lookups made within this many seconds of each other are sent as one request. 0 batches the lookups of one loop iteration.
+		:param bool lazy: Whether models keep their payload and only decode dates, durations and nested objects when they are first read.
+		'''
+
+		self.lazy = lazy
+		self.prefetch = prefetch
+		self.parallel_paging = parallel_paging
+		self.loader = None if batch_window is None else BatchLoader(batch_window)
 		self.auth = auth(self)
-		self.http = HTTP(self)
+		self.http = HTTP(
+			self,
+			max_concurrency=max_concurrency,
+			route_limits=route_limits,
+			retry_policy=retry_policy,
+			coalesce=coalesce,
+			cache=cache,
+			decoder=decoder,
+			executor=executor,
+			offload_threshold=offload_threshold,
+			lag_limit=lag_limit
+		)
 
 	async def __aenter__(self):
 		await self.auth.authorize()
@@ -77,6 +153,9 @@ class Client:
 	async def close(self):
 		'''Close this client session.'''
 
+		if self.loader is not None:
+			self.loader.close()
+
 		await self.auth.close()
 		await self.http.close()
 
@@ -231,34 +310,88 @@ class Client:
 		data = await self.http.search(
 			q, ','.join(actual_types),
 			market=market,
-			limit=clamp(limit, 50),
+			limit=first_page_limit('search', limit),
 			offset=offset,
 			include_external=include_external
 		)
 
 		results = {}
 
-		if 'tracks' in data:
-			results['tracks'] = []
-			async for track_obj in SearchPager(self.http, data, 'tracks', limit):
-				results['tracks'].append(SimpleTrack(self, track_obj))
+		for type, cls in (('tracks', SimpleTrack), ('albums', SimpleAlbum), ('artists', FullArtist), ('playlists', SimplePlaylist)):
+			if type in data:
+				results[type] = await collect(self._search_pager(data, type, cls, limit))
 
-		if 'albums' in data:
-			results['albums'] = []
-			async for album_obj in SearchPager(self.http, data, 'albums', limit):
-				results['albums'].append(SimpleAlbum(self, album_obj))
+		return results
 
-		if 'artists' in data:
-			results['artists'] = []
-			async for artist_obj in SearchPager(self.http, data, 'artists', limit):
-				results['artists'].append(FullArtist(self, artist_obj))
+	def _search_pager(self, data, type, cls, limit):
+		return SearchPager(
+			self.http, data, type, limit, self.prefetch, self.parallel_paging, partial(build_models, cls, self)
+		)
 
-		if 'playlists' in data:
-			results['playlists'] = []
-			async for artist_obj in SearchPager(self.http, data, 'playlists', limit):
-				results['playlists'].append(SimplePlaylist(self, artist_obj))
+	async def search_pager(
+		self, type, q, limit=None, market=None, offset=None, include_external=None, checkpoint=None
+	) -> SearchPager:
+		'''
+		Search for a single type, returning a pager instead of a list.
 
-		return results
+		Iterate it with ``async for`` for one item at a time, or with :meth:`Pager.pages` for whole pages.
+
+		:param str type: One of ``track``, ``album``, ``artist`` or ``playlist``.
+		:param str q: The search query.
+		:param int limit: How many results to yield in total. Defaults to all of them.
+		:param market: ISO-3166-1_ country code or the string ``from_token``.
+		:param offset: Where to start the pagination.
+		:param include_external: If this is equal to ``audio``, the response will include any relevant audio content that is hosted externally.
+		:param dict checkpoint: Resume from a :meth:`Pager.checkpoint` of an earlier pager instead of starting over.
+		:return: :class:`SearchPager` yielding :class:`SimpleTrack`, :class:`SimpleAlbum`, :class:`FullArtist` or :class:`SimplePlaylist`
+		'''
+
+		classes = dict(track=SimpleTrack, album=SimpleAlbum, artist=FullArtist, playlist=SimplePlaylist)
+		type = type.lower()
+
+		if type not in classes:
+			raise ValueError('Unknown type: %s' % type)
+
+		if checkpoint is not None:
+			return await self._resume(SearchPager, checkpoint, classes[type])
+
+		data = await self.http.search(
+			q, type,
+			market=market,
+			limit=first_page_limit('search', limit),
+			offset=offset,
+			include_external=include_external
+		)
+
+		return self._search_pager(data, type + 's', classes[type], limit)
+
+	async def iter_search(self, type, q, limit=None, market=None, offset=None, include_external=None):
+		'''
+		Search for a single type, yielding results as they are fetched instead of returning a list.
+
+		Takes the same arguments as :meth:`search_pager`.
+		'''
+
+		pager = await self.search_pager(type, q, limit, market, offset, include_external)
+
+		async for item in stream(pager):
+			yield item
+
+	async def count_search(self, type, q, market=None, include_external=None) -> int:
+		'''
+		Count the results of a search for a single type, without fetching them.
+
+		:param str type: One of ``track``, ``album``, ``artist`` or ``playlist``.
+		:param str q: The search query.
+		:param market: ISO-3166-1_ country code or the string ``from_token``.
+		:param include_external: If this is equal to ``audio``, the response will include any relevant audio content that is hosted externally.
+		:return: int
+		'''
+
+		type = type.lower()
+		data = await self.http.search(q, type, market=market, limit=1, include_external=include_external)
+
+		return data[type + 's']['total']
 
 	async def search_tracks(self, q, limit=20, market=None, offset=None, include_external=None) -> List[SimpleTrack]:
 		'''
@@ -376,7 +509,9 @@ class Client:
 		:return: List[:class:`SimpleTrack`]
 		'''
 
-		data = await self.http.get_me_top_tracks(limit=clamp(limit, 50), offset=offset, time_range=time_range)
+		data = await self.http.get_me_top_tracks(
+			limit=first_page_limit('me/top/tracks', limit), offset=offset, time_range=time_range
+		)
 
 		tracks = []
 		for track_obj in data['items']:
@@ -400,7 +535,9 @@ class Client:
 		:return: List[:class:`SimpleArtist`]
 		'''
 
-		data = await self.http.get_me_top_artists(limit=clamp(limit, 50), offset=offset, time_range=time_range)
+		data = await self.http.get_me_top_artists(
+			limit=first_page_limit('me/top/artists', limit), offset=offset, time_range=time_range
+		)
 
 		artists = []
 		for artist_obj in data['items']:
@@ -408,6 +545,30 @@ class Client:
 
 		return artists
 
+	async def count_me_top_tracks(self, time_range=None) -> int:
+		'''
+		Count the top tracks of the current user, without fetching them.
+
+		:param str time_range: The time period for which data are selected to form a top.
+		:return: int
+		'''
+
+		data = await self.http.get_me_top_tracks(limit=1, time_range=time_range)
+
+		return data['total']
+
+	async def count_me_top_artists(self, time_range=None) -> int:
+		'''
+		Count the top artists of the current user, without fetching them.
+
+		:param str time_range: The time period for which data are selected to form a top.
+		:return: int
+		'''
+
+		data = await self.http.get_me_top_artists(limit=1, time_range=time_range)
+
+		return data['total']
+
 	async def get_user(self, user_id) -> PublicUser:
 		'''
 		Get a user.
@@ -439,10 +600,7 @@ class Client:
 			description=description
 		)
 
-		playlist = FullPlaylist(self, data)
-		playlist._tracks = dict()
-
-		return playlist
+		return FullPlaylist(self, data)
 
 	async def edit_playlist(self, playlist, name=None, description=None, public=None, collaborative=None):
 		'''
@@ -487,38 +645,138 @@ class Client:
 		for chunk in subslice(uris, 100):
 			await self.http.playlist_add_tracks(playlist, uris=chunk, position=position)
 
-	async def get_playlist(self, playlist_id) -> FullPlaylist:
+	async def get_playlist(self, playlist_id, fields=None, market=None) -> FullPlaylist:
 		'''
 		Get a pre-existing playlist.
 
 		:param str playlist_id: Spotify ID of the playlist.
+		:param str fields: Only get these fields, e.g. ``name,tracks.items(track(id,name,external_ids))``. Attributes of fields left out are None.
+		:param market: ISO-3166-1_ country code or ``from_token``. Tracks then leave out their ``available_markets``.
 		:return: :class:`FullPlaylist` instance.
 		'''
 
-		data = await self.http.get_playlist(playlist_id)
-
-		playlist = FullPlaylist(self, data)
+		playlist = await self.http.get_playlist(
+			playlist_id, fields=fields, market=market, build=partial(FullPlaylist, self)
+		)
 
 		return playlist
 
-	async def get_playlist_tracks(self, playlist) -> List[PlaylistTrack]:
+	async def sync_playlist(self, playlist, state=None, storage=None, append_only=True) -> PlaylistState:
+		'''
+		Bring a mirrored playlist up to date, fetching as little as possible.
+
+		Only the snapshot ID of the playlist is fetched first. If it matches the one of ``state``, nothing else is.
+		If the playlist has only been appended to, which is detected by the last known item still being in its
+		place, only the new items are fetched. Otherwise all items are fetched again.
+
+		:param playlist: :class:`Playlist` instance or Spotify ID.
+		:param state: :class:`PlaylistState` from the previous sync, if any.
+		:param storage: :class:`PlaylistStorage` to load the previous state from (unless ``state`` is passed) and
+			store the new state in when it changed.
+		:param bool append_only: Whether to try fetching only new items. Pass False for playlists that get reordered.
+		:return: :class:`PlaylistState`
+		'''
+
+		playlist_id = get_id(playlist)
+
+		if state is None and storage is not None:
+			state = await storage.load(playlist_id)
+
+		data = await self.http.get_playlist(playlist_id, fields='snapshot_id,tracks.total')
+		snapshot_id = data['snapshot_id']
+		total = data['tracks']['total']
+
+		if state is not None and state.snapshot_id == snapshot_id:
+			state.changed = False
+			state.fetched = 0
+			return state
+
+		items = None
+		fetched = 0
+
+		if append_only and state is not None and state.items and total > state.total:
+			# fetch from the last known item on, it should still be in the same place
+			tail = await collect(self._playlist_items_pager(playlist_id, state.total - 1, total))
+			fetched = len(tail)
+
+			if tail and item_key(tail[0]) == item_key(state.items[-1]):
+				items = state.items + tail[1:]
+			else:
+				log.debug('Playlist %s was not only appended to, fetching all of it', playlist_id)
+
+		if items is None:
+			items = await collect(self._playlist_items_pager(playlist_id, 0, total))
+			fetched += len(items)
+
+		new_state = PlaylistState(playlist_id, snapshot_id, items)
+		new_state.changed = True
+		new_state.fetched = fetched
+
+		if storage is not None:
+			await storage.store(new_state)
+
+		return new_state
+
+	def _playlist_items_pager(self, playlist_id, offset, total):
+		url = Route('GET', 'playlists/{0}/tracks'.format(playlist_id)).url
+		return Pager(self.http, empty_page(url, offset, total), prefetch=self.prefetch, parallel=self.parallel_paging)
+
+	async def get_playlist_tracks(self, playlist, fields=None, market=None) -> List[PlaylistTrack]:
 		'''
 		Get tracks from a playlist.
 
 		:param playlist: :class:`Playlist` instance or Spotify ID.
+		:param str fields: Only get these fields of each page, e.g. ``items(added_at,track(id,name,external_ids))``. Attributes of fields left out are None.
+		:param market: ISO-3166-1_ country code or ``from_token``. Tracks then leave out their ``available_markets``.
 		:return: List[:class:`PlaylistTrack`]
 		'''
 
+		return await collect(await self.get_playlist_tracks_pager(playlist, fields=fields, market=market))
+
+	async def get_playlist_tracks_pager(self, playlist, checkpoint=None, fields=None, market=None) -> Pager:
+		'''
+		Get a pager over the tracks of a playlist.
+
+		:param playlist: :class:`Playlist` instance or Spotify ID.
+		:param dict checkpoint: Resume from a :meth:`Pager.checkpoint` of an earlier pager instead of starting over.
+		:param str fields: Only get these fields of each page. The fields needed for paging are always included.
+		:param market: ISO-3166-1_ country code or ``from_token``.
+		:return: :class:`Pager` yielding :class:`PlaylistTrack`
+		'''
+
+		if checkpoint is not None:
+			return await self._resume(Pager, checkpoint, PlaylistTrack)
+
 		playlist = get_id(playlist)
+		params = dict(fields=paging_fields(fields), market=market)
 
-		data = await self.http.get_playlist_tracks(playlist)
+		data = await self.http.get_playlist_tracks(
+			playlist, limit=first_page_limit('playlists/{0}/tracks'.format(playlist)), **params
+		)
 
-		tracks = []
+		return self._pager(data, PlaylistTrack, params=params)
 
-		async for track in Pager(self.http, data):
-			tracks.append(PlaylistTrack(self, track))
+	async def iter_playlist_tracks(self, playlist, fields=None, market=None):
+		'''
+		Iterate the tracks of a playlist as they are fetched, instead of returning a list.
 
-		return tracks
+		Takes the same arguments as :meth:`get_playlist_tracks`.
+		'''
+
+		async for track in stream(await self.get_playlist_tracks_pager(playlist, fields=fields, market=market)):
+			yield track
+
+	async def count_playlist_tracks(self, playlist) -> int:
+		'''
+		Count the tracks in a playlist, without fetching them.
+
+		:param playlist: :class:`Playlist` instance or Spotify ID.
+		:return: int
+		'''
+
+		data = await self.http.get_playlist_tracks(get_id(playlist), limit=1, fields='total')
+
+		return data['total']
 
 	async def get_user_playlists(self, user) -> List[SimplePlaylist]:
 		'''
@@ -528,51 +786,145 @@ class Client:
 		:return: List[:class:`SimplePlaylist`]
 		'''
 
+		return await collect(await self.get_user_playlists_pager(user))
+
+	async def get_user_playlists_pager(self, user, checkpoint=None) -> Pager:
+		'''
+		Get a pager over the attainable playlists a user owns.
+
+		:param user: :class:`User` instance or Spotify ID.
+		:param dict checkpoint: Resume from a :meth:`Pager.checkpoint` of an earlier pager instead of starting over.
+		:return: :class:`Pager` yielding :class:`SimplePlaylist`
+		'''
+
+		if checkpoint is not None:
+			return await self._resume(Pager, checkpoint, SimplePlaylist)
+
 		user = get_id(user)
 
-		data = await self.http.get_user_playlists(user)
+		data = await self.http.get_user_playlists(user, limit=first_page_limit('users/{0}/playlists'.format(user)))
 
-		playlists = []
+		return self._pager(data, SimplePlaylist)
 
-		async for playlist_obj in Pager(self.http, data):
-			if playlist_obj is None:
-				playlists.append(None)
-			else:
-				playlists.append(SimplePlaylist(self, playlist_obj))
+	async def iter_user_playlists(self, user):
+		'''
+		Iterate the attainable playlists a user owns as they are fetched, instead of returning a list.
 
-		return playlists
+		:param user: :class:`User` instance or Spotify ID.
+		'''
+
+		async for playlist in stream(await self.get_user_playlists_pager(user)):
+			yield playlist
+
+	async def count_user_playlists(self, user) -> int:
+		'''
+		Count the attainable playlists a user owns, without fetching them.
+
+		:param user: :class:`User` instance or Spotify ID.
+		:return: int
+		'''
+
+		data = await self.http.get_user_playlists(get_id(user), limit=1)
+
+		return data['total']
+
+	def _pager(self, data, cls, limit=None, params=None):
+		# leave out parameters that weren't passed
+		params = {k: v for k, v in (params or {}).items() if v is not None}
+
+		return Pager(
+			self.http, data, limit, self.prefetch, self.parallel_paging, partial(build_models, cls, self), params
+		)
+
+	async def _resume(self, pager_cls, checkpoint, cls):
+		return await pager_cls.resume(
+			self.http, checkpoint, prefetch=self.prefetch, parallel=self.parallel_paging,
+			build=partial(build_models, cls, self)
+		)
 
-	async def get_track(self, track_id) -> FullTrack:
+	async def _load(self, fetch, path, id, **params):
+		# None means the lookup wasn't batched and has to be made on its own
+		if self.loader is None:
+			return None
+
+		return await self.loader.load(fetch, path, get_id(id), **params)
+
+	async def _several(self, fetch, path, cls, objs, **params):
+		ids = [get_id(obj) for obj in split_ids(objs)]
+		found = await fetch_several(fetch, path, ids, **params)
+
+		# duplicate ids share the model built for them
+		models = {id: None if obj is None else cls(self, obj) for id, obj in found.items()}
+
+		return [models[id] for id in ids]
+
+	async def hydrate(self, objects, market=None) -> list:
+		'''
+		Replace simplified objects with their complete versions.
+
+		:class:`SimpleTrack`, :class:`SimpleAlbum` and :class:`SimpleArtist` instances are fetched in as few requests
+		as possible, all at once. Everything else, and objects Spotify has nothing for, are left as they are.
+
+		:param objects: List of objects, which can be of different types.
+		:param market: ISO-3166-1_ country code or ``from_token`` to get tracks and albums for.
+		:return: List of the objects in the same order, with the simplified ones replaced.
+		'''
+
+		objects = list(objects)
+		wanted = {}
+
+		for obj in objects:
+			path = hydrate_path(obj)
+			if path is not None:
+				wanted.setdefault(path, []).append(obj.id)
+
+		fetchers = dict(
+			tracks=(self.http.get_tracks, FullTrack, dict(market=market)),
+			albums=(self.http.get_albums, FullAlbum, dict(market=market)),
+			artists=(self.http.get_artists, FullArtist, dict()),
+		)
+
+		paths = list(wanted)
+		results = await asyncio.gather(*(
+			self._several(fetchers[path][0], path, fetchers[path][1], wanted[path], **fetchers[path][2])
+			for path in paths
+		))
+
+		full = {}
+
+		for path, models in zip(paths, results):
+			for id, model in zip(wanted[path], models):
+				if model is not None:
+					full[path, id] = model
+
+		return [full.get((hydrate_path(obj), getattr(obj, 'id', None)), obj) for obj in objects]
+
+	async def get_track(self, track_id, market=None) -> FullTrack:
 		'''
 		Get a track.
 
 		:param str track_id: Spotify ID of track.
+		:param market: ISO-3166-1_ country code or ``from_token``. The track then leaves out its ``available_markets``.
 		:return: :class:`FullTrack` instance.
 		'''
 
-		data = await self.http.get_track(track_id)
+		data = await self._load(self.http.get_tracks, 'tracks', track_id, market=market)
+
+		if data is None:
+			data = await self.http.get_track(track_id, market=market)
+
 		return FullTrack(self, data)
 
-	async def get_tracks(self, *track_ids) -> List[FullTrack]:
+	async def get_tracks(self, *track_ids, market=None) -> List[FullTrack]:
 		'''
 		Get several tracks.
 
 		:param str track_ids: List of track Spotify IDs.
+		:param market: ISO-3166-1_ country code or ``from_token``. Tracks then leave out their ``available_markets``.
 		:return: List[:class:`FullTrack`]
 		'''
 
-		tracks = []
-
-		for chunk in subslice(track_ids, 50):
-			data = await self.http.get_tracks(','.join(get_id(obj) for obj in chunk))
-
-			for track_obj in data['tracks']:
-				if track_obj is None:
-					tracks.append(None)
-				else:
-					tracks.append(FullTrack(self, track_obj))
-
-		return tracks
+		return await self._several(self.http.get_tracks, 'tracks', FullTrack, track_ids, market=market)
 
 	async def get_audio_features(self, track) -> AudioFeatures:
 		'''
@@ -596,9 +948,7 @@ class Client:
 		:return: list[:class:`AudioFeatures`]
 		'''
 
-		data = await self.http.get_audio_features_multiple_tracks(','.join(get_id(track) for track in tracks))
-		return [AudioFeatures(self, item) for item in data['audio_features']]
-
+		return await self._several(self.http.get_audio_features_multiple_tracks, 'audio-features', AudioFeatures, tracks)
 
 	async def get_audio_analysis(self, track) -> AudioAnalysis:
 		'''
@@ -610,9 +960,7 @@ class Client:
 
 		track = get_id(track)
 
-		data = await self.http.get_audio_analysis(track)
-
-		return AudioAnalysis(self, data)
+		return await self.http.get_audio_analysis(track, build=partial(AudioAnalysis, self))
 
 	async def get_artist(self, artist_id) -> FullArtist:
 		'''
@@ -622,7 +970,10 @@ class Client:
 		:return: :class:`FullArtist` instance.
 		'''
 
-		data = await self.http.get_artist(artist_id)
+		data = await self._load(self.http.get_artists, 'artists', artist_id)
+
+		if data is None:
+			data = await self.http.get_artist(artist_id)
 
 		return FullArtist(self, data)
 
@@ -640,16 +991,57 @@ class Client:
 		:return: List[:class:`SimpleAlbum`]
 		'''
 
-		albums = []
+		return await collect(await self.get_artist_albums_pager(artist_id, limit, include_groups, country, offset))
+
+	async def get_artist_albums_pager(
+		self, artist_id, limit=None, include_groups=None, country=None, offset=None, checkpoint=None
+	) -> Pager:
+		'''
+		Get a pager over an artist's albums.
+
+		:param str artist_id: Spotify ID of artist.
+		:param int limit: How many albums to yield in total. Defaults to all of them.
+		:param dict checkpoint: Resume from a :meth:`Pager.checkpoint` of an earlier pager instead of starting over.
+		:return: :class:`Pager` yielding :class:`SimpleAlbum`
+		'''
+
+		if checkpoint is not None:
+			return await self._resume(Pager, checkpoint, SimpleAlbum)
+
+		artist_id = get_id(artist_id)
 
 		data = await self.http.get_artist_albums(
-			artist_id, include_groups=include_groups, country=country, limit=clamp(limit, 50), offset=offset
+			artist_id, include_groups=include_groups, country=country,
+			limit=first_page_limit('artists/{0}/albums'.format(artist_id), limit), offset=offset
 		)
 
-		async for album_obj in Pager(self.http, data, limit):
-			albums.append(SimpleAlbum(self, album_obj))
+		return self._pager(data, SimpleAlbum, limit)
+
+	async def iter_artist_albums(self, artist_id, limit=None, include_groups=None, country=None, offset=None):
+		'''
+		Iterate an artist's albums as they are fetched, instead of returning a list.
+
+		Takes the same arguments as :meth:`get_artist_albums_pager`.
+		'''
+
+		pager = await self.get_artist_albums_pager(artist_id, limit, include_groups, country, offset)
+
+		async for album in stream(pager):
+			yield album
+
+	async def count_artist_albums(self, artist_id, include_groups=None, country=None) -> int:
+		'''
+		Count an artist's albums, without fetching them.
+
+		:param str artist_id: Spotify ID of artist.
+		:return: int
+		'''
+
+		data = await self.http.get_artist_albums(
+			get_id(artist_id), include_groups=include_groups, country=country, limit=1
+		)
 
-		return albums
+		return data['total']
 
 	async def get_artists(self, *artist_ids) -> List[FullArtist]:
 		'''
@@ -659,18 +1051,7 @@ class Client:
 		:return: List[:class:`FullArtist`]
 		'''
 
-		artists = []
-
-		for chunk in subslice(artist_ids, 2):
-			data = await self.http.get_artists(','.join(get_id(obj) for obj in chunk))
-
-			for artist_obj in data['artists']:
-				if artist_obj is None:
-					artists.append(None)
-				else:
-					artists.append(FullArtist(self, artist_obj))
-
-		return artists
+		return await self._several(self.http.get_artists, 'artists', FullArtist, artist_ids)
 
 	async def get_artist_top_tracks(self, artist, market=None) -> List[FullTrack]:
 		'''
@@ -721,11 +1102,12 @@ class Client:
 		:return: :class:`FullAlbum` instance.
 		'''
 
-		data = await self.http.get_album(album_id, market=market)
+		data = await self._load(self.http.get_albums, 'albums', album_id, market=market)
 
-		album = FullAlbum(self, data)
+		if data is None:
+			return await self.http.get_album(album_id, market=market, build=partial(FullAlbum, self))
 
-		return album
+		return FullAlbum(self, data)
 
 	async def get_albums(self, *album_ids, market=None) -> List[FullAlbum]:
 		'''
@@ -736,18 +1118,7 @@ class Client:
 		:return: List[:class:`FullAlbum`]
 		'''
 
-		albums = []
-
-		for chunk in subslice(album_ids, 20):
-			data = await self.http.get_albums(','.join(get_id(obj) for obj in chunk), market=market)
-
-			for album_obj in data['albums']:
-				if album_obj is None:
-					albums.append(None)
-				else:
-					albums.append(FullAlbum(self, album_obj))
-
-		return albums
+		return await self._several(self.http.get_albums, 'albums', FullAlbum, album_ids, market=market)
 
 	async def get_album_tracks(self, album, limit=20, offset=None, market=None) -> List[SimpleTrack]:
 		'''
@@ -760,17 +1131,53 @@ class Client:
 		:return: List[:class:`SimpleTrack`]
 		'''
 
+		return await collect(await self.get_album_tracks_pager(album, limit, offset, market))
+
+	async def get_album_tracks_pager(self, album, limit=None, offset=None, market=None, checkpoint=None) -> Pager:
+		'''
+		Get a pager over the tracks of an album.
+
+		:param album: :class:`Album` or Spotify ID of album.
+		:param limit: How many tracks to yield in total. Defaults to all of them.
+		:param offset: What pagination offset to start from.
+		:param market: ISO-3166-1_ country code.
+		:param dict checkpoint: Resume from a :meth:`Pager.checkpoint` of an earlier pager instead of starting over.
+		:return: :class:`Pager` yielding :class:`SimpleTrack`
+		'''
+
+		if checkpoint is not None:
+			return await self._resume(Pager, checkpoint, SimpleTrack)
+
 		album = get_id(album)
 
-		# assuming the limit is 50 for now
-		data = await self.http.get_album_tracks(album, limit=clamp(limit, 50), offset=offset, market=market)
+		data = await self.http.get_album_tracks(
+			album, limit=first_page_limit('albums/{0}/tracks'.format(album), limit), offset=offset, market=market
+		)
 
-		tracks = []
+		return self._pager(data, SimpleTrack, limit, params=dict(market=market))
 
-		async for track_obj in Pager(self.http, data, limit):
-			tracks.append(SimpleTrack(self, track_obj))
+	async def iter_album_tracks(self, album, limit=None, offset=None, market=None):
+		'''
+		Iterate the tracks of an album as they are fetched, instead of returning a list.
 
-		return tracks
+		Takes the same arguments as :meth:`get_album_tracks_pager`.
+		'''
+
+		async for track in stream(await self.get_album_tracks_pager(album, limit, offset, market)):
+			yield track
+
+	async def count_album_tracks(self, album, market=None) -> int:
+		'''
+		Count the tracks of an album, without fetching them.
+
+		:param album: :class:`Album` or Spotify ID of album.
+		:param market: ISO-3166-1_ country code.
+		:return: int
+		'''
+
+		data = await self.http.get_album_tracks(get_id(album), limit=1, market=market)
+
+		return data['total']
 
 	async def get_followed_artists(self, limit=20, after=None) -> List[SimpleArtist]:
 		'''
@@ -781,15 +1188,49 @@ class Client:
 		:return: List[:class:`SimpleArtist`]
 		'''
 
-		# assuming the limit is 50 for now
-		data = await self.http.get_followed_artists(type='artist', limit=clamp(limit, 50), after=after)
+		return await collect(await self.get_followed_artists_pager(limit, after))
 
-		artists = []
+	async def get_followed_artists_pager(self, limit=None, after=None, checkpoint=None) -> CursorBasedPaging:
+		'''
+		Get a pager over the user's followed artists.
 
-		async for artist_obj in CursorBasedPaging(self.http, data, 'artists', limit):
-			artists.append(SimpleArtist(self, artist_obj))
+		:param int limit: How many artists to yield in total. Defaults to all of them.
+		:param after: What artist ID to start the fetching from.
+		:param dict checkpoint: Resume from a :meth:`Pager.checkpoint` of an earlier pager instead of starting over.
+		:return: :class:`CursorBasedPaging` yielding :class:`SimpleArtist`
+		'''
 
-		return artists
+		if checkpoint is not None:
+			return await self._resume(CursorBasedPaging, checkpoint, SimpleArtist)
+
+		data = await self.http.get_followed_artists(
+			type='artist', limit=first_page_limit('me/following', limit), after=after
+		)
+
+		return CursorBasedPaging(
+			self.http, data, 'artists', limit, self.prefetch, build=partial(build_models, SimpleArtist, self)
+		)
+
+	async def iter_followed_artists(self, limit=None, after=None):
+		'''
+		Iterate the user's followed artists as they are fetched, instead of returning a list.
+
+		Takes the same arguments as :meth:`get_followed_artists_pager`.
+		'''
+
+		async for artist in stream(await self.get_followed_artists_pager(limit, after)):
+			yield artist
+
+	async def count_followed_artists(self) -> int:
+		'''
+		Count the user's followed artists, without fetching them.
+
+		:return: int
+		'''
+
+		data = await self.http.get_followed_artists(type='artist', limit=1)
+
+		return data['artists']['total']
 
 	async def following(self, type, *ids, limit=None, after=None):
 		'''
@@ -803,6 +1244,3 @@ class Client:
 
 		# not sure what this endpoint is doing, it doesn't take a limit at least. will look at it some other time
 		raise NotImplementedError
-
-		for chunk in subslice(ids, 50):
-			await self.http.following(type=type, ids=','.join(get_id(obj) for obj in chunk), limit=clamp(limit, 50), after=after)
@@ -0,0 +1,57 @@
+'''
+JSON decoders for response bodies.
+
+A decoder is any callable taking the raw response body as ``bytes`` and returning the decoded object. It should
+raise a :class:`ValueError` (or a subclass of it) if the body is not valid JSON.
+'''
+
+import json
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+try:
+	import msgspec
+except ImportError:
+	msgspec = None
+
+
+def stdlib_decoder(body):
+	'''Decode using the standard library :mod:`json` module.'''
+
+	return json.loads(body)
+
+
+if orjson is not None:
+	def orjson_decoder(body):
+		'''Decode using orjson.'''
+
+		return orjson.loads(body)
+else:
+	orjson_decoder = None
+
+
+if msgspec is not None:
+	_msgspec_decode = msgspec.json.Decoder().decode
+
+	def msgspec_decoder(body):
+		'''Decode using msgspec.'''
+
+		try:
+			return _msgspec_decode(body)
+		except msgspec.DecodeError as exc:
+			raise ValueError(str(exc)) from exc
+else:
+	msgspec_decoder = None
+
+
+def default_decoder():
+	'''Get the fastest decoder available, preferring orjson, then msgspec and falling back to the standard library.'''
+
+	for decoder in (orjson_decoder, msgspec_decoder):
+		if decoder is not None:
+			return decoder
+
+	return stdlib_decoder
@@ -19,12 +19,14 @@ class Device(SpotifyObject):
 		Volume of this device. Integer between 0 to 100.
 	'''
 
+	__slots__ = ('is_active', 'is_private_session', 'is_restricted', 'volume_percent')
+
 	_type = 'device'
 
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
-		self.is_active = data.pop('is_active')
-		self.is_private_session = data.pop('is_private_session')
-		self.is_restricted = data.pop('is_restricted')
-		self.volume_percent = data.pop('volume_percent')
+		self.is_active = data['is_active']
+		self.is_private_session = data['is_private_session']
+		self.is_restricted = data['is_restricted']
+		self.volume_percent = data['volume_percent']
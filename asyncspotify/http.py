@@ -1,12 +1,18 @@
 import asyncio
 import logging
-from asyncio import Lock, sleep
-from json import JSONDecodeError, loads
+from asyncio import Semaphore
+from contextlib import asynccontextmanager
+from functools import partial
+from fnmatch import fnmatchcase
 from urllib.parse import urlencode
 
-from aiohttp import ClientSession
+from aiohttp import ClientError, ClientSession
 
+from .decoders import default_decoder
 from .exceptions import *
+from .offload import Offloader
+from .ratelimit import RateLimiter
+from .retry import RATE_LIMITED, SERVER_ERROR, RetryPolicy
 
 log = logging.getLogger(__name__)
 
@@ -23,6 +29,23 @@ class Route:
 		self.url = url if url.startswith('http') else '{0}/{1}'.format(self.BASE, url)
 		self.params = {k: v for k, v in params.items() if v is not None}
 
+		# path relative to the API base, without query, used for matching routes against patterns
+		if self.url.startswith(self.BASE + '/'):
+			self.path = self.url[len(self.BASE) + 1:].partition('?')[0]
+		else:
+			self.path = self.url.partition('?')[0]
+
+	@property
+	def key(self):
+		'''Hashable key identifying this route, its method and its params.'''
+
+		return self.method, self.url, tuple(sorted(self.params.items()))
+
+	def matches(self, pattern):
+		'''Whether this route matches a pattern such as ``playlists/*/tracks``.'''
+
+		return fnmatchcase(self.path, pattern)
+
 	def __repr__(self):
 		return '<Route {0.method} url={0.url} params={0.params}>'.format(self)
 
@@ -34,17 +57,105 @@ class Route:
 
 
 class HTTP:
-	_attempts = 5
+	'''
+	Request engine used by :class:`Client`.
+
+	Requests are dispatched concurrently. ``max_concurrency`` caps the amount of requests in flight at any time,
+	and ``route_limits`` optionally maps route patterns (e.g. ``search`` or ``playlists/*/tracks``) to a
+	separate, lower in-flight limit for routes matching that pattern. The first matching pattern is used.
+
+	All requests also pass through a shared :class:`RateLimiter`, so a 429 from one request pauses every other
+	request until its ``Retry-After`` has passed. Server errors and connection failures are retried according to
+	``retry_policy``, a :class:`RetryPolicy`.
+
+	With ``coalesce`` enabled, identical GET requests (same URL, params and authorization) that are issued while
+	one is already in flight share its response instead of being sent again. ``coalesced`` counts those requests.
 
-	def __init__(self, client, loop=None):
+	If a :class:`ResponseCache` is passed as ``cache``, GET responses are cached according to its policies.
+
+	Response bodies are decoded from bytes by ``decoder``, which defaults to the fastest JSON library installed
+	(orjson, then msgspec, then the standard library).
+
+	Responses of at least ``offload_threshold`` bytes are decoded, and their models built, in ``executor`` if one
+	is passed, see :class:`Offloader`. Parsing that happens on the loop is measured against ``lag_limit``.
+	'''
+
+	def __init__(
+		self, client, loop=None, max_concurrency=10, route_limits=None, retry_policy=None,
+		coalesce=True, cache=None, decoder=None, executor=None, offload_threshold=256 * 1024, lag_limit=0.1
+	):
 		self.client = client
 		self.session = ClientSession(loop=loop or asyncio.get_event_loop())
-		self.lock = Lock()
+
+		if max_concurrency < 1:
+			raise ValueError('max_concurrency has to be at least 1')
+
+		self.max_concurrency = max_concurrency
+		self.route_limits = dict(route_limits or {})
+		self._route_semaphores = {}
+
+		self.ratelimiter = RateLimiter(max_window=max_concurrency)
+		self.retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+
+		self.coalesce = coalesce
+		self.coalesced = 0
+		self._in_flight = {}
+
+		self.cache = cache
+		self.decoder = default_decoder() if decoder is None else decoder
+		self.offloader = Offloader(executor, threshold=offload_threshold, lag_limit=lag_limit)
 
 	async def close(self):
 		await self.session.close()
 
-	async def request(self, route, data=None, json=None, headers=None, authorize=True):
+	async def decode(self, body):
+		'''Decode a response body, returning ``None`` if it is empty or not JSON.'''
+
+		if not body:
+			return None
+
+		try:
+			return await self.offloader.decode(self.decoder, body)
+		except ValueError:
+			return None
+
+	def _route_semaphore(self, route):
+		for pattern, limit in self.route_limits.items():
+			if route.matches(pattern):
+				semaphore = self._route_semaphores.get(pattern)
+				if semaphore is None:
+					semaphore = Semaphore(limit)
+					self._route_semaphores[pattern] = semaphore
+				return semaphore
+		return None
+
+	@asynccontextmanager
+	async def _slot(self, route):
+		route_semaphore = self._route_semaphore(route)
+
+		if route_semaphore is None:
+			async with self.ratelimiter:
+				yield
+		else:
+			async with route_semaphore, self.ratelimiter:
+				yield
+
+	async def request(self, route, data=None, json=None, headers=None, authorize=True, build=None):
+		'''
+		Send a request and return the decoded response.
+
+		If ``build`` is passed, it is called with the decoded response and its return value is returned instead.
+		For large responses it is run in the executor of the :class:`Offloader`.
+		'''
+
+		payload, size = await self._fetch(route, data, json, headers, authorize)
+
+		if build is None or payload is None:
+			return payload
+
+		return await self.offloader.build(build, payload, size)
+
+	async def _fetch(self, route, data, json, headers, authorize):
 		if authorize:
 			auth_header = self.client.auth.header
 			if auth_header is None:
@@ -67,57 +178,146 @@ class HTTP:
 			kw['json'] = json
 			kw['headers']['Content-Type'] = 'application/json'
 
-		async with self.lock:
-			for attempt in range(self._attempts):
+		send_kw = {}
+
+		if self.cache is not None and route.method == 'GET' and not data and not json:
+			ttl = self.cache.ttl(route)
+
+			if ttl is not None:
+				entry = self.cache.get(route.key)
 
-				async with self.session.request(**kw) as r:
-					status_code = r.status
-					headers = r.headers
-					text = await r.text()
+				if entry is not None and entry.fresh:
+					log.debug('[cached] %s', repr(route))
 
-					log.debug('[%s] %s', status_code, repr(route))
+					if entry.payload is None:
+						raise NotFound(entry.response, entry.error)
 
-					try:
-						data = loads(text)
-					except JSONDecodeError:
-						data = None
+					return entry.payload, entry.size
 
-					if 200 <= status_code < 300:
-						return data
+				send_kw.update(cache_key=route.key, cache_ttl=ttl)
 
-					try:
-						error = data['error']['message']
-					except (TypeError, KeyError):
-						error = None
+				if entry is not None:
+					send_kw.update(etag=entry.etag)
 
-					if status_code == 429:
-						retry_after = int(headers.get('Retry-After', 1)) + 1
-						log.warning('Rate limited. Retrying in %s seconds.', retry_after)
-						await sleep(retry_after)
-						continue
+		if self.coalesce and route.method == 'GET' and not data and not json:
+			return await self._coalesced(route, kw, **send_kw)
 
-					elif status_code == 400:
-						raise BadRequest(r, error)
+		return await self._send(route, kw, **send_kw)
 
-					elif status_code == 401:
-						raise Unauthorized(r, error)
+	async def _coalesced(self, route, kw, **send_kw):
+		headers = kw['headers'] or {}
+		key = route.key + (headers.get('Authorization'),)
 
-					elif status_code == 403:
-						raise Forbidden(r, error)
+		task = self._in_flight.get(key)
 
-					elif status_code == 404:
-						raise NotFound(r, error)
+		if task is None:
+			task = asyncio.ensure_future(self._send(route, kw, **send_kw))
+			self._in_flight[key] = task
+			task.add_done_callback(partial(self._land, key))
+		else:
+			self.coalesced += 1
+			log.debug('Coalescing %r with an identical request in flight', route)
 
-					elif status_code == 405:
-						raise NotAllowed(r, error)
+		# models copy what they keep of their payload, so every waiter can share it
+		return await asyncio.shield(task)
 
-					elif status_code >= 500:
-						continue
+	def _land(self, key, task):
+		if self._in_flight.get(key) is task:
+			del self._in_flight[key]
 
-					else:
-						raise HTTPException(r, 'Unhandled HTTP status code: %s' % status_code)
+		# retrieve the exception in case every waiter was cancelled
+		if not task.cancelled():
+			task.exception()
 
-		raise HTTPException(r, 'Request failed 5 times.')
+	async def _send(self, route, kw, cache_key=None, cache_ttl=None, etag=None):
+		self.retry_policy.budget.deposit()
+		attempt = 0
+
+		while True:
+			if etag is None:
+				request_kw = kw
+			else:
+				request_kw = dict(kw, headers=dict(kw['headers'] or {}, **{'If-None-Match': etag}))
+
+			try:
+				# only hold a slot while the request is actually in flight, the rate limiter
+				# holds back every request while waiting out a 429
+				async with self._slot(route):
+					async with self.session.request(**request_kw) as r:
+						status_code = r.status
+						headers = r.headers
+						body = await r.read()
+			except (ClientError, asyncio.TimeoutError) as exc:
+				kind = self.retry_policy.classify(exc)
+				if kind is None or not self.retry_policy.should_retry(kind, attempt):
+					raise
+
+				await self.retry_policy.backoff(kind, attempt, route)
+				attempt += 1
+				continue
+
+			log.debug('[%s] %s', status_code, repr(route))
+
+			data = await self.decode(body)
+
+			if 200 <= status_code < 300:
+				self.ratelimiter.success()
+
+				if cache_key is not None and data is not None:
+					self.cache.set(cache_key, data, cache_ttl, etag=headers.get('ETag'), size=len(body))
+
+				return data, len(body)
+
+			if status_code == 304 and etag is not None:
+				self.ratelimiter.success()
+
+				entry = self.cache.revalidated(cache_key, cache_ttl)
+				if entry is not None:
+					return entry.payload, entry.size
+
+				# the stored response was evicted while we were revalidating it, ask for the full response
+				etag = None
+				continue
+
+			try:
+				error = data['error']['message']
+			except (TypeError, KeyError):
+				error = None
+
+			if status_code == 429:
+				retry_after = int(headers.get('Retry-After', 1)) + 1
+				self.ratelimiter.throttle(retry_after)
+				kind = RATE_LIMITED
+
+			elif status_code == 400:
+				raise BadRequest(r, error)
+
+			elif status_code == 401:
+				raise Unauthorized(r, error)
+
+			elif status_code == 403:
+				raise Forbidden(r, error)
+
+			elif status_code == 404:
+				if cache_key is not None:
+					self.cache.set_missing(cache_key, r, error)
+
+				raise NotFound(r, error)
+
+			elif status_code == 405:
+				raise NotAllowed(r, error)
+
+			elif status_code >= 500:
+				kind = SERVER_ERROR
+
+			else:
+				raise HTTPException(r, 'Unhandled HTTP status code: %s' % status_code)
+
+			if not self.retry_policy.should_retry(kind, attempt):
+				raise HTTPException(r, 'Request failed {0} times.'.format(attempt + 1))
+
+			await self.retry_policy.backoff(kind, attempt, route)
+			attempt += 1
 
 	async def get_player(self, **kwargs):
 		r = Route('GET', 'me/player', **kwargs)
@@ -193,19 +393,20 @@ class HTTP:
 		r = Route('GET', 'me/top/artists', **kwargs)
 		return await self.request(r)
 
-	async def get_playlist(self, playlist_id):
-		r = Route('GET', 'playlists/{0}'.format(playlist_id))
-		return await self.request(r)
+	async def get_playlist(self, playlist_id, build=None, **kwargs):
+		r = Route('GET', 'playlists/{0}'.format(playlist_id), **kwargs)
+		return await self.request(r, build=build)
 
 	async def get_me_playlists(self):
 		raise NotImplemented
 
-	async def get_user_playlists(self, user_id):
-		r = Route('GET', 'users/{0}/playlists'.format(user_id), limit=50)
+	async def get_user_playlists(self, user_id, **kwargs):
+		kwargs.setdefault('limit', 50)
+		r = Route('GET', 'users/{0}/playlists'.format(user_id), **kwargs)
 		return await self.request(r)
 
-	async def get_playlist_tracks(self, playlist_id):
-		r = Route('GET', 'playlists/{0}/tracks'.format(playlist_id))
+	async def get_playlist_tracks(self, playlist_id, **kwargs):
+		r = Route('GET', 'playlists/{0}/tracks'.format(playlist_id), **kwargs)
 		return await self.request(r)
 
 	async def playlist_add_tracks(self, playlist_id, **kwargs):
@@ -230,25 +431,25 @@ class HTTP:
 		r = Route('GET', 'users/{0}'.format(user_id))
 		return await self.request(r)
 
-	async def get_track(self, track_id):
-		r = Route('GET', 'tracks/{0}'.format(track_id))
+	async def get_track(self, track_id, **kwargs):
+		r = Route('GET', 'tracks/{0}'.format(track_id), **kwargs)
 		return await self.request(r)
 
-	async def get_tracks(self, track_ids):
-		r = Route('GET', 'tracks', ids=track_ids)
+	async def get_tracks(self, track_ids, **kwargs):
+		r = Route('GET', 'tracks', ids=track_ids, **kwargs)
 		return await self.request(r)
 
-	async def get_audio_features_multiple_tracks(self, track_ids):
-		r = Route('GET', 'audio-features', ids=track_ids)
+	async def get_audio_features_multiple_tracks(self, track_ids, **kwargs):
+		r = Route('GET', 'audio-features', ids=track_ids, **kwargs)
 		return await self.request(r)
 
 	async def get_audio_features(self, track_id):
 		r = Route('GET', 'audio-features/{0}'.format(track_id))
 		return await self.request(r)
 
-	async def get_audio_analysis(self, track_id):
+	async def get_audio_analysis(self, track_id, build=None):
 		r = Route('GET', 'audio-analysis/{0}'.format(track_id))
-		return await self.request(r)
+		return await self.request(r, build=build)
 
 	async def get_artist(self, artist_id):
 		r = Route('GET', 'artists/{0}'.format(artist_id))
@@ -258,8 +459,8 @@ class HTTP:
 		req = Route('GET', 'artists/{0}/albums'.format(artist_id), **kwargs)
 		return await self.request(req)
 
-	async def get_artists(self, artist_ids):
-		r = Route('GET', 'artists', ids=artist_ids)
+	async def get_artists(self, artist_ids, **kwargs):
+		r = Route('GET', 'artists', ids=artist_ids, **kwargs)
 		return await self.request(r)
 
 	async def get_artist_top_tracks(self, artist_id, **kwargs):
@@ -270,9 +471,9 @@ class HTTP:
 		r = Route('GET', 'artists/{0}/related-artists'.format(artist_id))
 		return await self.request(r)
 
-	async def get_album(self, album_id, **kwargs):
+	async def get_album(self, album_id, build=None, **kwargs):
 		r = Route('GET', 'albums/{0}'.format(album_id), **kwargs)
-		return await self.request(r)
+		return await self.request(r, build=build)
 
 	async def get_albums(self, album_ids, **kwargs):
 		r = Route('GET', 'albums', ids=album_ids, **kwargs)
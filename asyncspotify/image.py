@@ -1,4 +1,7 @@
-class Image:
+from .object import Freezable
+
+
+class Image(Freezable):
 	'''
 	Represents an image.
 
@@ -10,10 +13,12 @@ class Image:
 		Height of the image.
 	'''
 
+	__slots__ = ('url', 'width', 'height')
+
 	def __init__(self, data):
-		self.url = data.pop('url')
-		self.width = data.pop('width')
-		self.height = data.pop('height')
+		self.url = data.get('url', None)
+		self.width = data.get('width', None)
+		self.height = data.get('height', None)
 
 	def __str__(self):
 		return self.url
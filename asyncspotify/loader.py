@@ -0,0 +1,107 @@
+import asyncio
+import logging
+
+from .bulk import fetch_several
+from .exceptions import BadRequest
+
+log = logging.getLogger(__name__)
+
+
+class BatchLoader:
+	'''
+	Collects single object lookups and sends them together as several items requests.
+
+	Lookups made within ``window`` seconds of the first one, or within the same loop iteration if ``window`` is 0,
+	are grouped per endpoint and parameters and fetched with :func:`fetch_several`.
+
+	window: float
+		Seconds a batch waits for more lookups before it is sent.
+	batches: int
+		How many batches have been sent.
+	loaded: int
+		How many lookups have been answered by a batch.
+	'''
+
+	def __init__(self, window=0.0):
+		self.window = window
+
+		self.batches = 0
+		self.loaded = 0
+
+		self._pending = {}
+		self._tasks = set()
+
+	def __repr__(self):
+		return '<BatchLoader window={0.window} batches={0.batches} loaded={0.loaded}>'.format(self)
+
+	async def load(self, fetch, path, id, **params):
+		'''
+		Look up ``id`` with the next batch sent to ``path``.
+
+		:return: The object, or None if the batch had nothing for it and it should be looked up on its own.
+		'''
+
+		key = (path, tuple(sorted(params.items())))
+		batch = self._pending.get(key)
+
+		if batch is None:
+			batch = self._pending[key] = (fetch, {})
+			loop = asyncio.get_event_loop()
+
+			if self.window:
+				loop.call_later(self.window, self._send, key)
+			else:
+				loop.call_soon(self._send, key)
+
+		future = asyncio.get_event_loop().create_future()
+		batch[1].setdefault(id, []).append(future)
+
+		return await future
+
+	def _send(self, key):
+		task = asyncio.ensure_future(self._dispatch(key))
+		self._tasks.add(task)
+		task.add_done_callback(self._tasks.discard)
+
+	async def _dispatch(self, key):
+		fetch, waiting = self._pending.pop(key)
+		path, params = key
+
+		self.batches += 1
+		log.debug('Sending a batch of %s %s', len(waiting), path)
+
+		try:
+			found = await fetch_several(fetch, path, list(waiting), **dict(params))
+		except BadRequest as exc:
+			# a single bad id fails the whole batch, let every lookup find out on its own
+			log.debug('Batch of %s failed, looking them up one by one: %s', path, exc)
+			found = {}
+		except asyncio.CancelledError:
+			for futures in waiting.values():
+				for future in futures:
+					future.cancel()
+			raise
+		except Exception as exc:
+			for futures in waiting.values():
+				for future in futures:
+					if not future.done():
+						future.set_exception(exc)
+			return
+
+		for id, futures in waiting.items():
+			data = found.get(id)
+
+			for future in futures:
+				if future.done():
+					continue
+
+				if data is not None:
+					self.loaded += 1
+
+				future.set_result(data)
+
+	def close(self):
+		'''Cancel batches that are being sent.'''
+
+		for task in self._tasks:
+			task.cancel()
@@ -1,51 +1,79 @@
 import logging
+from types import MappingProxyType
 
 from .http import Route
 from .image import Image
 from .object import SpotifyObject
-from .pager import Pager
+from .pager import Pager, empty_page, page_limit
 
 log = logging.getLogger(__name__)
 
+_empty = MappingProxyType({})
+
 
 class ArtistMixin:
-	def __init__(self, data):
+	__slots__ = ()
+
+	def _decode_artists(self, data):
 		from .artist import SimpleArtist
 
-		artists = data.pop('artists')
-		self.artists = []
+		return [SimpleArtist(self._client, art) for art in data.get('artists', None) or ()]
+
+	async def full_artists(self):
+		'''
+		Replace ``artists`` with their complete versions, fetched together.
 
-		for art in artists:
-			self.artists.append(SimpleArtist(self._client, art))
+		:return: List[:class:`FullArtist`]
+		'''
+
+		self.artists = await self._client.hydrate(self.artists)
+		return self.artists
 
 
 class ImageMixin:
-	def __init__(self, data):
-		images = data.pop('images', None)
-		self.images = []
+	__slots__ = ()
 
-		if images is not None:
-			for img in images:
-				self.images.append(Image(img))
+	def _decode_images(self, data):
+		return [Image(img) for img in data.get('images', None) or ()]
 
 
 class ExternalIDMixin:
-	def __init__(self, data):
-		external_ids = data.pop('external_ids')
-		self.external_ids = {}
+	__slots__ = ()
 
-		for key, value in external_ids.items():
-			self.external_ids[key] = value
+	def __init__(self, data):
+		# a read only view of the payload instead of a copy, it can be shared with other objects
+		external_ids = data.get('external_ids', None)
+		self.external_ids = _empty if external_ids is None else MappingProxyType(external_ids)
 
 
 class ExternalURLMixin:
+	__slots__ = ()
+
 	def __init__(self, data):
-		external_urls = data.pop('external_urls')
-		self.external_urls = {}
+		external_urls = data.get('external_urls', None)
+		self.external_urls = _empty if external_urls is None else MappingProxyType(external_urls)
+		self.link = self.external_urls.get('spotify', None)
+
+
+_markets = {}
+
+
+def shared_markets(markets, max_size=1024):
+	'''
+	Turn a list of markets into a tuple shared by every object available in the same markets.
+
+	Most tracks and albums list the same markets, and holding a copy of each list is most of their memory.
+	'''
+
+	if markets is None:
+		return None
 
-		self.link = external_urls.get('spotify', None)
-		for site, url in external_urls.items():
-			self.external_urls[site] = url
+	markets = tuple(markets)
+
+	if len(_markets) >= max_size:
+		return _markets.get(markets, markets)
+
+	return _markets.setdefault(markets, markets)
 
 
 def valid_item(item):
@@ -58,47 +86,138 @@ def valid_item(item):
 
 
 class TrackMixin:
+	__slots__ = ()
+
 	def __init__(self, data):
-		tracks = data.pop('tracks', None)
+		self.__total = None
+		self.__loaded = 0
+		self.tracks = []
+		self.track_count = None
+
+		tracks = data.get('tracks', None)
 		if tracks is None:
 			return
 
-		items = tracks.pop('items', None)
+		self.__total = tracks.get('total')
+
+		self.track_count = self.__total
+
+		items = tracks.get('items', None)
 		if items is None:
 			return
 
-		self.tracks = []
+		self._load_tracks(items)
 
-		for item in items:
-			if valid_item(item):
-				self._add_track(item)
+	def __aiter__(self):
+		'''Iterate all tracks in this object. Also updates the ``tracks`` cache.'''
 
-		self.__total = tracks.get('total')
-		self.__limit = tracks.get('limit')
+		return self.iter_tracks(retain=True)
 
-		self.track_count = self.__total
+	async def iter_tracks(self, retain=False):
+		'''
+		Iterate all tracks in this object, fetching the ones not loaded yet as they are needed.
 
-	async def __aiter__(self):
-		'''Create a pager and iterate all tracks in this object. Also updates the ``tracks`` cache.'''
+		Tracks that are already loaded are yielded first and not fetched again, unless the playlist has changed since
+		they were loaded.
 
-		self.tracks = []
+		With ``retain`` set, fetched tracks are added to the ``tracks`` cache. Otherwise they are not kept, and pages
+		are only read ahead as far as the client ``prefetch`` setting allows, so memory use stays flat no matter how
+		many tracks there are, and the ``tracks`` cache is left as it is even if the playlist has changed.
+		'''
+
+		snapshot = await self._newer_snapshot()
 
-		# get new pager
-		r = Route('GET', '{0}s/{1}/tracks'.format(self._type, self.id), offset=0, limit=self.__limit)
+		if snapshot is None:
+			loaded, offset, total = list(self.tracks), self.__loaded, self.__total
+		else:
+			# the loaded tracks are outdated, only start over on them when retaining
+			loaded, offset, total = [], 0, snapshot['tracks']['total']
+
+			if retain:
+				self.snapshot_id = snapshot['snapshot_id']
+				self.tracks = []
+				self.__loaded = 0
+				self.__total = self.track_count = total
+
+		for track in loaded:
+			yield track
+
+		pager = await self._pager_from(offset, total, parallel=self._client.parallel_paging and retain)
+
+		async for items in pager.pages():
+			if retain:
+				for track in self._load_tracks(items):
+					yield track
+			else:
+				for item in items:
+					if valid_item(item):
+						yield self._make_track(item)
+
+	async def _newer_snapshot(self):
+		'''The snapshot id and track count of this object, if the loaded tracks are from an older snapshot.'''
+
+		snapshot_id = getattr(self, 'snapshot_id', None)
+
+		if snapshot_id is None or not self.__loaded:
+			return None
+
+		r = Route('GET', '{0}s/{1}'.format(self._type, self.id), fields='snapshot_id,tracks.total')
+		data = await self._client.http.request(r)
+
+		if data['snapshot_id'] == snapshot_id:
+			return None
+
+		return data
+
+	async def _pager_from(self, offset, total, parallel):
+		path = '{0}s/{1}/tracks'.format(self._type, self.id)
+
+		if total is not None:
+			return Pager(
+				self._client.http, self._empty_page(offset, total), prefetch=self._client.prefetch, parallel=parallel
+			)
+
+		# nothing is known about the tracks yet, the first page tells how many there are
+		r = Route('GET', path, offset=offset, limit=page_limit(path))
 		pager_data = await self._client.http.request(r)
 
-		self.__total = pager_data.get('total')
+		self.__total = pager_data['total']
 		self.track_count = self.__total
 
-		async for item in Pager(self._client.http, pager_data):
-			if valid_item(item):
-				yield self._add_track(item)
-			else:
-				# if it's not a valid item it shouldn't count towards the total track count goal
-				self.__total -= 1
+		return Pager(self._client.http, pager_data, prefetch=self._client.prefetch, parallel=parallel)
+
+	def _empty_page(self, offset, total):
+		url = Route('GET', '{0}s/{1}/tracks'.format(self._type, self.id)).url
+		return empty_page(url, offset, total)
+
+	def track_pager(self):
+		'''
+		Create a pager over the tracks of this object, without fetching anything yet.
+
+		Mostly useful for random access, which only fetches the pages covering the requested tracks:
+
+		.. code-block:: py
+
+			tracks = await playlist.track_pager()[5000:5100]
+
+		Invalid items, like tracks that have since been removed, are returned as None.
+
+		:raises ValueError: If the track count is not known, like for objects fetched without their ``tracks``.
+		'''
+
+		if self.__total is None:
+			raise ValueError('Track count of {0} is unknown, fetch it with its tracks first'.format(self.id))
+
+		return Pager(
+			self._client.http, self._empty_page(0, self.__total), prefetch=self._client.prefetch,
+			parallel=self._client.parallel_paging, build=self._build_tracks
+		)
+
+	def _build_tracks(self, items):
+		return [self._make_track(item) if valid_item(item) else None for item in items]
 
 	async def fill(self):
-		'''Update this objects ``tracks`` cache.'''
+		'''Update this objects ``tracks`` cache, fetching only the tracks that aren't loaded yet.'''
 
 		async for track in self:
 			pass
@@ -106,7 +225,8 @@ class TrackMixin:
 	def is_filled(self):
 		'''Whether this object contains as many tracks as advertised by the previous pager.'''
 
-		return len(self.tracks) >= self.__total
+		# invalid items are never added to tracks, so count what was loaded instead
+		return self.__total is not None and self.__loaded >= self.__total
 
 	def has_track(self, track):
 		'''Check if this object has a track.'''
@@ -115,7 +235,18 @@ class TrackMixin:
 			track = track.id
 		return any(track == t.id for t in self.tracks)
 
+	def _make_track(self, track_data):
+		return self._track_class(self._client, track_data)
+
 	def _add_track(self, track_data):
-		track = self._track_class(self._client.http, track_data)
+		track = self._make_track(track_data)
 		self.tracks.append(track)
 		return track
+
+	def _load_tracks(self, items):
+		'''Add a page of items following the ones loaded so far, returning the tracks added.'''
+
+		tracks = [self._add_track(item) for item in items if valid_item(item)]
+		self.__loaded += len(items)
+
+		return tracks
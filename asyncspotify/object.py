@@ -1,4 +1,145 @@
-class SpotifyObject:
+from types import MappingProxyType
+
+_slot_names = {}
+_frozen_classes = {}
+
+
+def slot_names(cls):
+	'''Names of every slot of ``cls``, including those of its bases.'''
+
+	names = _slot_names.get(cls)
+
+	if names is None:
+		names = []
+		for base in reversed(cls.__mro__):
+			slots = base.__dict__.get('__slots__', ())
+			names.extend((slots,) if isinstance(slots, str) else slots)
+		names = _slot_names[cls] = tuple(names)
+
+	return names
+
+
+def frozen_value(value):
+	'''A read only version of an attribute value.'''
+
+	if isinstance(value, Freezable):
+		return value.freeze()
+	if isinstance(value, list):
+		return tuple(frozen_value(item) for item in value)
+	if isinstance(value, dict):
+		return MappingProxyType(value)
+	return value
+
+
+def copied_value(value):
+	'''A copy of a decoded JSON value, so changing it leaves the payload it came from alone.'''
+
+	if isinstance(value, dict):
+		return {key: copied_value(item) for key, item in value.items()}
+	if isinstance(value, list):
+		return [copied_value(item) for item in value]
+	return value
+
+
+def _read_only(self, *args):
+	raise AttributeError('{0} is frozen and can not be modified'.format(type(self).__name__))
+
+
+def _hash_id(self):
+	return hash(self.id)
+
+
+def frozen_class(cls):
+	'''The frozen variant of ``cls``, a subclass whose instances can not be modified.'''
+
+	frozen = _frozen_classes.get(cls)
+
+	if frozen is None:
+		namespace = dict(
+			__slots__=(), __module__=cls.__module__, __doc__=cls.__doc__, frozen=True,
+			__setattr__=_read_only, __delattr__=_read_only,
+		)
+
+		# objects comparing by id can be hashed by it once they can't change
+		if cls.__hash__ is None:
+			namespace['__hash__'] = _hash_id
+
+		frozen = _frozen_classes[cls] = type('Frozen' + cls.__name__, (cls,), namespace)
+
+	return frozen
+
+
+class Freezable:
+	'''
+	Base of models that can be frozen into read only objects.
+
+	frozen: bool
+		Whether this object has been frozen.
+	'''
+
+	__slots__ = ()
+
+	frozen = False
+
+	def freeze(self):
+		'''
+		Make this object read only, along with everything it holds.
+
+		Lists become tuples, dicts become read only views and nested objects are frozen as well. Frozen objects can be
+		shared between any number of tasks without copying, and objects with an ``id`` become hashable.
+
+		:return: This object, now an instance of the frozen variant of its class.
+		'''
+
+		if self.frozen:
+			return self
+
+		for name in slot_names(type(self)):
+			try:
+				value = getattr(self, name)
+			except AttributeError:
+				continue
+
+			frozen = frozen_value(value)
+			if frozen is not value:
+				setattr(self, name, frozen)
+
+		self.__class__ = frozen_class(type(self))
+		return self
+
+
+class LazyAttribute:
+	'''
+	Wraps the slot of an attribute that is decoded from the payload of its object the first time it is read.
+
+	The decoded value is stored in the slot, so later reads cost the same as any other attribute.
+	'''
+
+	__slots__ = ('slot', 'decode')
+
+	def __init__(self, slot, decode):
+		self.slot = slot
+		self.decode = decode
+
+	def __get__(self, obj, cls=None):
+		if obj is None:
+			return self
+
+		try:
+			return self.slot.__get__(obj, cls)
+		except AttributeError:
+			value = self.decode(obj, obj._data)
+			self.slot.__set__(obj, value)
+			return value
+
+	def __set__(self, obj, value):
+		self.slot.__set__(obj, value)
+
+	def __delete__(self, obj):
+		self.slot.__delete__(obj)
+
+
+class SpotifyObject(Freezable):
 	'''
 	Represents a generic Spotify Object.
 	
@@ -14,14 +155,50 @@ class SpotifyObject:
 		
 	'''
 
+	__slots__ = ('_client', '_data', 'id', 'name', 'href', 'uri')
+
 	_type = None
+	_lazy = ()
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+
+		# slots with a _decode_<name> method are decoded on first access in lazy mode
+		for name in cls.__dict__.get('__slots__', ()):
+			decode = getattr(cls, '_decode_' + name, None)
+			if decode is not None:
+				setattr(cls, name, LazyAttribute(cls.__dict__[name], decode))
+
+		cls._lazy = tuple(name for name in dir(cls) if isinstance(getattr(cls, name, None), LazyAttribute))
 
 	def __init__(self, client, data):
 		self._client = client
-		self.id = data.pop('id', None)
-		self.name = data.pop('name', None)
-		self.href = data.pop('href', None)
-		self.uri = data.pop('uri', None)
+		# payloads can be shared with other objects, lazy ones only get to read theirs
+		self._data = MappingProxyType(data)
+
+		if not getattr(client, 'lazy', False):
+			self._decode()
+
+		self.id = data.get('id', None)
+		self.name = data.get('name', None)
+		self.href = data.get('href', None)
+		self.uri = data.get('uri', None)
+
+	def _decode(self):
+		'''Decode every lazy attribute not read yet and let go of the payload.'''
+
+		for name in self._lazy:
+			getattr(self, name)
+
+		self._data = None
+
+	def freeze(self):
+		if not self.frozen:
+			self._decode()
+
+		return super().freeze()
+
+	freeze.__doc__ = Freezable.freeze.__doc__
 
 	@property
 	def type(self):
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from time import perf_counter
+
+log = logging.getLogger(__name__)
+
+
+class LagMonitor:
+	'''
+	Keeps track of how long parsing on the event loop blocks it.
+
+	Whenever decoding or building models on the loop takes longer than ``limit`` seconds a warning is logged.
+
+	blocked: int
+		How many times parsing blocked the loop for longer than ``limit``.
+	max_lag: float
+		Longest time in seconds parsing has blocked the loop.
+	total_lag: float
+		Total time in seconds of the parsing that blocked the loop for longer than ``limit``.
+	'''
+
+	def __init__(self, limit=0.1):
+		self.limit = limit
+
+		self.blocked = 0
+		self.max_lag = 0.0
+		self.total_lag = 0.0
+
+	def __repr__(self):
+		return '<LagMonitor blocked={0.blocked} max_lag={0.max_lag:.3f}>'.format(self)
+
+	@contextmanager
+	def measure(self, what):
+		'''Measure how long the block takes, reporting it if it takes longer than ``limit``.'''
+
+		start = perf_counter()
+
+		try:
+			yield
+		finally:
+			took = perf_counter() - start
+
+			if took > self.max_lag:
+				self.max_lag = took
+
+			if self.limit is not None and took > self.limit:
+				self.blocked += 1
+				self.total_lag += took
+				log.warning('%s blocked the event loop for %.0f ms', what, took * 1000)
+
+
+class Offloader:
+	'''
+	Runs heavy parsing in an executor instead of on the event loop.
+
+	Work on payloads of at least ``threshold`` bytes is sent to ``executor``. Everything else, or everything if no
+	executor is set, runs on the loop and is measured by ``lag``, a :class:`LagMonitor`.
+
+	Decoding can run in both thread and process pools. Models hold a reference to the client and can't be sent to
+	another process, so with a process pool they are always built on the loop.
+	'''
+
+	def __init__(self, executor=None, threshold=256 * 1024, lag_limit=0.1):
+		self.executor = executor
+		self.threshold = threshold
+		self.lag = LagMonitor(lag_limit)
+
+		self.offloaded = 0
+
+	def __repr__(self):
+		return '<Offloader executor={0.executor!r} threshold={0.threshold} offloaded={0.offloaded}>'.format(self)
+
+	@property
+	def builds_models(self):
+		'''Whether models are built in the executor as well.'''
+
+		return self.executor is not None and not isinstance(self.executor, ProcessPoolExecutor)
+
+	async def decode(self, decoder, body):
+		'''Decode ``body``, in the executor if it is large enough.'''
+
+		if self.executor is not None and len(body) >= self.threshold:
+			return await self._offload(decoder, body)
+
+		with self.lag.measure('Decoding %s bytes' % len(body)):
+			return decoder(body)
+
+	async def build(self, factory, data, size):
+		'''Build a model from ``data``, a payload decoded from ``size`` bytes, in the executor if it is large enough.'''
+
+		if self.builds_models and size >= self.threshold:
+			return await self._offload(factory, data)
+
+		return self.build_on_loop(factory, data)
+
+	def build_on_loop(self, factory, data):
+		'''Build a model from ``data`` on the loop, measured by ``lag``.'''
+
+		name = getattr(factory, 'func', factory)
+		with self.lag.measure('Building %s' % getattr(name, '__qualname__', 'models')):
+			return factory(data)
+
+	async def _offload(self, func, *args):
+		self.offloaded += 1
+		return await asyncio.get_event_loop().run_in_executor(self.executor, partial(func, *args))
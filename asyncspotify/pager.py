@@ -1,62 +1,485 @@
+import asyncio
 import logging
+from collections import deque
+from fnmatch import fnmatchcase
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from .http import Route
 
 log = logging.getLogger(__name__)
 
+# the largest page each paging endpoint hands out, first matching pattern wins
+PAGE_LIMITS = (
+	('playlists/*/tracks', 100),
+	('albums/*/tracks', 50),
+	('artists/*/albums', 50),
+	('users/*/playlists', 50),
+	('me/playlists', 50),
+	('me/following', 50),
+	('me/top/*', 50),
+	('me/tracks', 50),
+	('me/albums', 50),
+	('search', 50),
+	('browse/*', 50),
+)
+
+# what the API falls back to when no limit is passed
+DEFAULT_PAGE_LIMIT = 20
+
+# what pagers need to be left in paging objects filtered with ``fields``
+PAGING_FIELDS = 'href,limit,next,offset,previous,total'
+
+
+def page_limit(path):
+	'''The largest page size allowed by the endpoint at ``path``, such as ``playlists/{id}/tracks``.'''
+
+	for pattern, limit in PAGE_LIMITS:
+		if fnmatchcase(path, pattern):
+			return limit
+
+	return DEFAULT_PAGE_LIMIT
+
+
+def paging_fields(fields):
+	'''Extend a ``fields`` filter for a paging endpoint so pagers can still page through it.'''
+
+	return None if fields is None else '{0},{1}'.format(fields, PAGING_FIELDS)
+
+
+def first_page_limit(path, limit=None):
+	'''The limit to fetch the first page of ``path`` with, when at most ``limit`` items are wanted.'''
+
+	size = page_limit(path)
+	return size if limit is None else max(1, min(size, limit))
+
+
+def empty_page(url, offset, total):
+	'''
+	A paging object without items, pointing at the page at ``offset`` of the collection at ``url``.
+
+	Pagers made from it fetch nothing until they are used, and can schedule their first page together with the rest.
+	'''
+
+	limit = page_limit(Route('GET', url).path)
+
+	return dict(
+		href=url, total=total, limit=limit, offset=offset, previous=None, items=[],
+		next='{0}?{1}'.format(url, urlencode(dict(offset=offset, limit=limit))),
+	)
+
+
+def plan_pages(offset, count, size):
+	'''
+	Split ``count`` items starting at ``offset`` into as few pages of at most ``size`` items as possible.
+
+	Returns a list of ``(offset, limit)`` tuples. The last page is cut short so nothing past ``count`` is fetched.
+	'''
+
+	end = offset + count
+	return [(start, min(size, end - start)) for start in range(offset, end, size)]
+
 
 class Pager:
-	def __init__(self, http, pager_object, limit=None):
+	'''
+	Iterates the items of a paging object, fetching the following pages as needed.
+
+	With ``prefetch`` set, up to that many of the following pages are fetched in the background while the current
+	page is being consumed. Pages that are read ahead are held until consumed, so memory use stays bounded.
+	Call :meth:`close` (or use ``async with``) when stopping early to cancel pages being read ahead.
+
+	With ``parallel`` set, the offsets of all remaining pages are computed from the first page and every page is
+	requested at once, within the concurrency limits of the client. Items are still yielded in order.
+	Cursor based pagers can't know their following pages up front, and ignore ``parallel``.
+
+	If ``build`` is passed, it is called with the raw items of every page and should return a list of the same
+	length, for example of models. Its return values are what the pager yields.
+
+	``params`` are extra query parameters sent with every following page, such as ``fields`` or ``market``.
+
+	Offset based pagers also support random access without iterating, fetching only the pages covering the
+	requested items. Indices are relative to the first item of the pager:
+
+	.. code-block:: py
+
+		track = await pager.get(5000)
+		tracks = await pager[5000:5100]
+
+	The position of a pager can be saved with :meth:`checkpoint` and picked up again later, even in another
+	process, with :meth:`resume`.
+	'''
+
+	_offset_based = True
+
+	def __init__(self, http, pager_object, limit=None, prefetch=0, parallel=False, build=None, params=None):
 		self.http = http
-		self.pos = 0
 		self.self_limit = limit
+		self.prefetch = prefetch
+		self.parallel = parallel and self._offset_based
+		self.build = build
+		self.params = params or {}
+
+		self.offset = 0
+		self.items = []
+		self._ahead = deque()
+		self._scheduled = 0
+
 		self.set_next(pager_object)
 
-	def set_next(self, obj):
-		self.total = obj['total']
-		self.next = obj['next']
-		self.previous = obj['previous']
-		self.items = obj['items']
-		self.limit = obj['limit']
-		self.offset = obj['offset']
+		# positions are offsets into the whole collection, which might not start at zero
+		self.start = self.offset
+		self.pos = self.start
+
+		# following pages are requested as large as the endpoint allows
+		url = self.href or self.next
+		self.page_size = self.limit if url is None else max(self.limit, page_limit(Route('GET', url).path))
+
+	def _page(self, obj):
+		'''Get the paging object out of a response.'''
+
+		return obj
+
+	def _page_offset(self, page):
+		return page['offset']
+
+	def set_next(self, obj, items=None):
+		page = self._page(obj)
+
+		self.offset = self._page_offset(page)
+		self.href = page.get('href')
+		self.total = page['total']
+		self.next = page['next']
+		self.previous = page['previous']
+		if items is not None:
+			self.items = items
+		elif self.build is None:
+			self.items = page['items']
+		else:
+			self.items = self.http.offloader.build_on_loop(self.build, page['items'])
+		self.limit = page['limit']
+
+	@property
+	def end(self):
+		'''Position after the last item this pager will yield.'''
+
+		if self.self_limit is None:
+			return self.total
+		return min(self.total, self.start + self.self_limit)
+
+	def __len__(self):
+		return max(0, self.end - self.start)
 
 	async def get_next(self):
-		r = Route('GET', self.next)
-		obj = await self.http.request(r)
-		self.set_next(obj)
+		if self._ahead:
+			fetched = await self._ahead.popleft()
+		elif self._offset_based:
+			pages = self._plan(1)
+			fetched = await self._fetch_planned(*pages[0]) if pages else None
+		else:
+			fetched = await self._fetch(self._cursor_url(self.next, self.offset + len(self.items)))
+
+		if fetched is None:
+			# read ahead found no more pages
+			self.next = None
+			return
+
+		self.set_next(*fetched)
+		self._read_ahead()
+
+	async def _fetch(self, url):
+		'''Fetch the page at ``url``, returning it along with its items, built by the offloader of ``http``.'''
+
+		return await self.http.request(Route('GET', url), build=self._build_page)
+
+	def _build_page(self, obj):
+		items = self._page(obj)['items']
+		return obj, items if self.build is None else self.build(items)
+
+	def _url(self, offset, limit):
+		'''URL of the page starting at ``offset``, based on the URL of the current page.'''
+
+		parts = urlsplit(self.href or self.next)
+		query = dict(parse_qsl(parts.query))
+		query.update(self.params)
+		query.update(offset=offset, limit=limit)
+
+		return urlunsplit(parts._replace(query=urlencode(query)))
+
+	def _cursor_url(self, url, position):
+		'''``url`` with its limit set so the page starting at ``position`` stops at the end of this pager.'''
+
+		parts = urlsplit(url)
+		query = dict(parse_qsl(parts.query))
+		query.update(limit=min(self.page_size, self.end - position))
+
+		return urlunsplit(parts._replace(query=urlencode(query)))
+
+	async def _follow(self, previous, position):
+		fetched = await previous
+
+		if fetched is None:
+			return None
+
+		url = self._page(fetched[0])['next']
+
+		if url is None:
+			return None
+
+		return await self._fetch(self._cursor_url(url, position))
+
+	def _plan(self, count=None):
+		'''The following pages not requested yet, at most ``count`` of them.'''
+
+		offset = max(self._scheduled, self.offset + len(self.items))
+		pages = plan_pages(offset, self.end - offset, self.page_size)
+
+		return pages if count is None else pages[:count]
+
+	def _fetch_planned(self, offset, limit):
+		self._scheduled = offset + limit
+		return self._fetch(self._url(offset, limit))
+
+	def _read_ahead(self):
+		if not self._offset_based:
+			self._read_ahead_cursors()
+			return
+
+		# with parallel set every remaining page is requested at once
+		wanted = None if self.parallel else max(0, self.prefetch - len(self._ahead))
+
+		for offset, limit in self._plan(wanted):
+			self._ahead.append(asyncio.ensure_future(self._fetch_planned(offset, limit)))
+
+	def _read_ahead_cursors(self):
+		# each page follows the cursor of the one before it, so they are requested one after another
+		position = max(self._scheduled, self.offset + len(self.items))
+
+		while len(self._ahead) < self.prefetch and position < self.end:
+			if self._ahead:
+				task = asyncio.ensure_future(self._follow(self._ahead[-1], position))
+			elif self.next is not None:
+				task = asyncio.ensure_future(self._fetch(self._cursor_url(self.next, position)))
+			else:
+				break
+
+			self._ahead.append(task)
+			position = self._scheduled = position + min(self.page_size, self.end - position)
+
+	def checkpoint(self):
+		'''
+		Get the position of this pager as a dict that can be serialized, for example to JSON.
+
+		Pass it to :meth:`resume` to continue where this pager left off. Only the page holding the next item is
+		fetched again when resuming, pages that were fully consumed are not.
+		'''
+
+		skip = 0
+
+		if self.pos >= self.end:
+			url = None
+		elif self._offset_based:
+			url = self._url(self.pos, min(self.page_size, self.end - self.pos))
+		elif self.pos < self.offset + len(self.items):
+			# cursors only point at whole pages, get the current one again and skip what was already consumed
+			url = self.href
+			skip = self.pos - self.offset
+		else:
+			url = self.next
+
+		return dict(
+			type=getattr(self, 'type', None),
+			url=url,
+			skip=skip,
+			pos=self.pos,
+			start=self.start,
+			limit=self.self_limit,
+			page_size=self.page_size,
+			total=self.total,
+			params=self.params,
+		)
+
+	@classmethod
+	async def resume(cls, http, checkpoint, **kwargs):
+		'''
+		Create a pager continuing from a ``checkpoint`` made by :meth:`checkpoint`.
+
+		Any other arguments, like ``prefetch`` or ``build``, are passed on to the pager.
+		'''
+
+		type = checkpoint['type']
+		url = checkpoint['url']
+
+		if type is not None:
+			kwargs['type'] = type
+
+		kwargs.setdefault('params', checkpoint.get('params'))
+
+		if url is None:
+			# nothing left, make up an empty last page instead of asking for one
+			page = dict(
+				href=None, next=None, previous=None, items=[], cursors=None,
+				total=checkpoint['total'], limit=checkpoint['page_size'], offset=checkpoint['pos'],
+			)
+			obj = page if type is None else {type: page}
+		else:
+			obj = await http.request(Route('GET', url))
+
+		pager = cls(http, obj, **kwargs)
+
+		pager.offset = checkpoint['pos'] - checkpoint['skip']
+		pager.pos = checkpoint['pos']
+		pager.start = checkpoint['start']
+		pager.self_limit = checkpoint['limit']
+		pager.page_size = checkpoint['page_size']
+
+		return pager
+
+	def close(self):
+		'''Cancel any pages being read ahead.'''
+
+		while self._ahead:
+			task = self._ahead.popleft()
+
+			if not task.done():
+				task.cancel()
+			elif not task.cancelled():
+				# retrieve the exception so it isn't reported as never retrieved
+				task.exception()
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+	# __getitem__ returns coroutines, don't let it be mistaken for the sequence protocol
+	__iter__ = None
+
+	def __getitem__(self, key):
+		if isinstance(key, slice):
+			return self._slice(key)
+		return self.get(key)
+
+	async def get(self, index):
+		'''Get the item at ``index``, fetching only the page holding it.'''
+
+		if index < 0:
+			index += len(self)
+
+		if not 0 <= index < len(self):
+			raise IndexError('pager index out of range')
+
+		items = await self._fetch_range(self.start + index, self.start + index + 1)
+		return items[0]
+
+	async def _slice(self, key):
+		indices = range(*key.indices(len(self)))
+
+		if not indices:
+			return []
+
+		low = min(indices)
+		items = await self._fetch_range(self.start + low, self.start + max(indices) + 1)
+
+		return [items[index - low] for index in indices]
+
+	async def _fetch_range(self, start, stop):
+		'''Get the items from offset ``start`` up to ``stop``.'''
+
+		if not self._offset_based:
+			raise TypeError('cursor based pagers do not support random access')
+
+		# the current page might already hold them
+		if self.offset <= start and stop <= self.offset + len(self.items):
+			return self.items[start - self.offset:stop - self.offset]
+
+		pages = await asyncio.gather(*(
+			self._fetch(self._url(offset, limit)) for offset, limit in plan_pages(start, stop - start, self.page_size)
+		))
+
+		items = []
+
+		for obj, page_items in pages:
+			items.extend(page_items)
+
+		return items
 
 	def __aiter__(self):
 		return self
 
 	async def __anext__(self):
-		# stop if we hit the pager total or the specified pager limit
-		if self.pos >= self.total:
+		if not await self._advance():
+			self.close()
 			raise StopAsyncIteration
 
-		if self.self_limit is not None and self.pos >= self.self_limit:
-			raise StopAsyncIteration
+		item = self.items[self.pos - self.offset]
+		self.pos += 1
+		return item
+
+	async def pages(self):
+		'''
+		Iterate the remaining items a page at a time, as lists.
+
+		This costs one await per page instead of one per item, which adds up when iterating large collections.
+		'''
+
+		try:
+			while await self._advance():
+				start = self.pos - self.offset
+				batch = self.items[start:min(len(self.items), self.end - self.offset)]
+				self.pos += len(batch)
+				yield batch
+		finally:
+			self.close()
+
+	iter_batches = pages
+
+	async def _advance(self):
+		'''Make sure the current page holds the item at ``pos``. Returns False if there are no more items.'''
+
+		# stop if we hit the pager total or the specified pager limit
+		if self.pos >= self.end:
+			return False
 
 		# get the next page if we're exhausted this one
-		if self.pos >= self.offset + self.limit:
+		if self.pos >= self.offset + len(self.items):
+			if self.next is None:
+				return False
+
+			# pagers starting out without items shouldn't fetch their first page on its own
+			self._start_reading_ahead()
+
 			await self.get_next()
 
-		item = self.items[self.pos - self.offset]
-		self.pos += 1
-		return item
+			# the new page might be empty if the total changed while paging
+			if self.pos >= self.offset + len(self.items):
+				return False
+
+		# start reading ahead once iteration starts
+		self._start_reading_ahead()
+
+		return True
+
+	def _start_reading_ahead(self):
+		if (self.prefetch or self.parallel) and not self._ahead:
+			self._read_ahead()
 
 
 class SearchPager(Pager):
-	def __init__(self, http, obj, type, limit=None):
+	def __init__(self, http, obj, type, limit=None, prefetch=0, parallel=False, build=None, params=None):
 		self.type = type
-		super().__init__(http, obj, limit)
+		super().__init__(http, obj, limit, prefetch, parallel, build, params)
 
-	def set_next(self, obj):
-		obj = obj[self.type]
-		super().set_next(obj)
+	def _page(self, obj):
+		return obj[self.type]
 
 
 class CursorBasedPaging(SearchPager):
-	def set_next(self, obj):
-		obj[self.type]['offset'] = None
-		self.cursors = obj[self.type]['cursors']
-		super().set_next(obj)
+	_offset_based = False
+
+	def _page_offset(self, page):
+		# cursor based paging objects have no offset, count the items seen instead
+		return self.offset + len(self.items)
+
+	def set_next(self, obj, items=None):
+		self.cursors = self._page(obj)['cursors']
+		super().set_next(obj, items)
@@ -21,17 +21,19 @@ class CurrentlyPlaying(SpotifyObject):
 		What is currently playing, can be ``track``, ``episode``, ``ad`` or ``unknown``.
 	'''
 
+	__slots__ = ('timestamp', 'progress', 'is_playing', 'track', 'currently_playing_type')
+
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
-		self.timestamp = datetime.utcfromtimestamp(data.pop('timestamp') / 1000)
-		self.progress = timedelta(milliseconds=data.pop('progress_ms'))
-		self.is_playing = data.pop('is_playing')
+		self.timestamp = datetime.utcfromtimestamp(data['timestamp'] / 1000)
+		self.progress = timedelta(milliseconds=data['progress_ms'])
+		self.is_playing = data['is_playing']
 
-		item = data.pop('item', None)
+		item = data.get('item', None)
 		self.track = None if item is None else FullTrack(client, item)
 
-		self.currently_playing_type = data.pop('currently_playing_type')
+		self.currently_playing_type = data['currently_playing_type']
 
 
 class CurrentlyPlayingContext(CurrentlyPlaying):
@@ -48,12 +50,14 @@ class CurrentlyPlayingContext(CurrentlyPlaying):
 		The shuffle state of the player. Can be ``True`` or ``False``.
 	'''
 
+	__slots__ = ('device', 'repeat_state', 'shuffle_state')
+
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
-		self.device = Device(client, data.pop('device'))
-		self.repeat_state = data.pop('repeat_state')
-		self.shuffle_state = data.pop('shuffle_state')
+		self.device = Device(client, data['device'])
+		self.repeat_state = data['repeat_state']
+		self.shuffle_state = data['shuffle_state']
 
 	async def next(self):
 		'''Skips to the next track.'''
@@ -5,6 +5,11 @@ from .track import PlaylistTrack
 
 
 class _BasePlaylist(SpotifyObject, TrackMixin, ExternalURLMixin, ImageMixin):
+	__slots__ = (
+		'_TrackMixin__total', '_TrackMixin__loaded', 'tracks', 'track_count', 'external_urls', 'link', 'images',
+		'snapshot_id', 'collaborative', 'public', 'owner',
+	)
+
 	_type = 'playlist'
 	_track_class = PlaylistTrack
 
@@ -13,13 +18,14 @@ class _BasePlaylist(SpotifyObject, TrackMixin, ExternalURLMixin, ImageMixin):
 
 		TrackMixin.__init__(self, data)
 		ExternalURLMixin.__init__(self, data)
-		ImageMixin.__init__(self, data)
 
-		self.snapshot_id = data.pop('snapshot_id')
-		self.collaborative = data.pop('collaborative')
-		self.public = data.pop('public')
+		self.snapshot_id = data.get('snapshot_id', None)
+		self.collaborative = data.get('collaborative', None)
+		self.public = data.get('public', None)
 
-		self.owner = PublicUser(client, data.pop('owner'))
+	def _decode_owner(self, data):
+		owner = data.get('owner', None)
+		return None if owner is None else PublicUser(self._client, owner)
 
 	async def edit(self, name=None, public=None, collaborative=None, description=None):
 		'''
@@ -73,7 +79,7 @@ class SimplePlaylist(_BasePlaylist):
 		Name of the playlist.
 	tracks: List[:class:`SimpleTrack`]
 		All tracks in the playlist.
-	track_count: int
+	track_count: int or None
 		The expected track count as advertised by the last paging object. ``is_filled()`` can return True even if fewer tracks than this exists in ``tracks``, since some fetched tracks from the API can be None for various reasons.
 	uri: str
 		Spotify URI of the playlist.
@@ -87,12 +93,14 @@ class SimplePlaylist(_BasePlaylist):
 		Whether the playlist is public.
 	owner: :class:`PublicUser`
 		Owner of the playlist.
-	external_urls: dict
-		Dictionary that maps type to url.
+	external_urls: Mapping[str, str]
+		Read only mapping of type to url.
 	images: List[:class:`Image`]
 		List of associated images.
 	'''
 
+	__slots__ = ()
+
 
 class FullPlaylist(_BasePlaylist):
 	'''
@@ -108,9 +116,12 @@ class FullPlaylist(_BasePlaylist):
 		Follower count of the playlist.
 	'''
 
+	__slots__ = ('description', 'primary_color', 'follower_count')
+
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
-		self.description = data.pop('description')
-		self.primary_color = data.pop('primary_color')
-		self.follower_count = data['followers']['total']
+		self.description = data.get('description', None)
+		self.primary_color = data.get('primary_color', None)
+		followers = data.get('followers', None)
+		self.follower_count = None if followers is None else followers['total']
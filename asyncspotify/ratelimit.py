@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from asyncio import sleep
+from collections import deque
+from time import monotonic
+
+log = logging.getLogger(__name__)
+
+
+class RateLimiter:
+	'''
+	Client-wide adaptive rate limiter.
+
+	Works as an AIMD (additive increase, multiplicative decrease) concurrency window. Every successful response
+	grows the window slightly until it reaches ``max_window``. A 429 response shrinks the window by ``decrease``
+	and pauses *all* outgoing requests until its ``Retry-After`` has passed, after which the window probes back up.
+
+	window: float
+		Current size of the concurrency window.
+	in_flight: int
+		Amount of requests currently holding a slot.
+	throttle_count: int
+		How many times the limiter has been throttled by a 429 response.
+	'''
+
+	def __init__(self, max_window=10, min_window=1, decrease=0.5, increase=1.0, rate_period=10.0):
+		if max_window < 1 or min_window < 1:
+			raise ValueError('Window sizes have to be at least 1')
+
+		self.max_window = max_window
+		self.min_window = min(min_window, max_window)
+		self.decrease = decrease
+		self.increase = increase
+		self.rate_period = rate_period
+
+		self.window = float(max_window)
+		self.in_flight = 0
+		self.paused_until = 0.0
+		self.throttle_count = 0
+
+		self._waiters = deque()
+		self._completed = deque()
+
+	def __repr__(self):
+		return '<RateLimiter state={0.state} window={0.window:.2f} in_flight={0.in_flight} rate={0.rate:.2f}>'.format(self)
+
+	@property
+	def state(self):
+		'''``paused`` while waiting out a ``Retry-After``, ``recovering`` while the window is below its maximum, otherwise ``open``.'''
+
+		if self.paused_for > 0:
+			return 'paused'
+		if self.window < self.max_window:
+			return 'recovering'
+		return 'open'
+
+	@property
+	def paused_for(self):
+		'''Seconds left until the current pause clears.'''
+
+		return max(self.paused_until - monotonic(), 0.0)
+
+	@property
+	def rate(self):
+		'''Successful requests per second over the last ``rate_period`` seconds.'''
+
+		self._prune(monotonic())
+		return len(self._completed) / self.rate_period
+
+	async def __aenter__(self):
+		await self.acquire()
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		self.release()
+
+	async def acquire(self):
+		'''Wait until a request can be sent, and take a slot in the window.'''
+
+		while True:
+			delay = self.paused_until - monotonic()
+			if delay > 0:
+				await sleep(delay)
+				continue
+
+			if self.in_flight < self._size():
+				self.in_flight += 1
+				return
+
+			fut = asyncio.get_event_loop().create_future()
+			self._waiters.append(fut)
+
+			try:
+				await fut
+			except asyncio.CancelledError:
+				# pass the wakeup on if we were woken up and cancelled at the same time
+				if fut.done() and not fut.cancelled():
+					self._wake()
+				raise
+			finally:
+				if fut in self._waiters:
+					self._waiters.remove(fut)
+
+	def release(self):
+		'''Give a slot back.'''
+
+		self.in_flight -= 1
+		self._wake()
+
+	def success(self):
+		'''Register a successful response, growing the window.'''
+
+		now = monotonic()
+		self._completed.append(now)
+		self._prune(now)
+
+		if self.window < self.max_window:
+			self.window = min(self.window + self.increase / self.window, float(self.max_window))
+			self._wake()
+
+	def throttle(self, retry_after):
+		'''Register a 429 response, shrinking the window and pausing all requests for ``retry_after`` seconds.'''
+
+		now = monotonic()
+
+		# responses from the same burst all carry a Retry-After, only shrink once per pause
+		if now >= self.paused_until:
+			self.window = max(self.window * self.decrease, float(self.min_window))
+			self.throttle_count += 1
+			log.warning('Rate limited. Pausing requests for %s seconds, window is now %.2f.', retry_after, self.window)
+
+		self.paused_until = max(self.paused_until, now + retry_after)
+
+	def _size(self):
+		return max(int(self.window), self.min_window)
+
+	def _wake(self):
+		free = self._size() - self.in_flight
+		for fut in self._waiters:
+			if free <= 0:
+				break
+			if not fut.done():
+				fut.set_result(None)
+				free -= 1
+
+	def _prune(self, now):
+		cutoff = now - self.rate_period
+		while self._completed and self._completed[0] < cutoff:
+			self._completed.popleft()
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import socket
+from asyncio import sleep
+from collections import Counter
+from random import uniform
+from time import monotonic
+
+from aiohttp import ClientConnectionError, ClientConnectorError, ClientPayloadError
+
+log = logging.getLogger(__name__)
+
+SERVER_ERROR = 'server_error'
+RATE_LIMITED = 'rate_limited'
+CONNECTION_RESET = 'connection_reset'
+DNS_FAILURE = 'dns_failure'
+TIMEOUT = 'timeout'
+
+
+class RetryBudget:
+	'''
+	Client-wide budget that bounds retries to a fraction of the requests sent.
+
+	Every request deposits ``ratio`` tokens and every retry withdraws one. On top of that ``min_per_second`` tokens
+	are refilled every second, so a quiet client can still retry. When a service is failing everywhere the budget
+	runs dry and requests fail fast instead of multiplying the load.
+	'''
+
+	def __init__(self, ratio=0.2, min_per_second=1.0, max_balance=10.0):
+		self.ratio = ratio
+		self.min_per_second = min_per_second
+		self.max_balance = max_balance
+
+		self.balance = max_balance
+		self._last = monotonic()
+
+	def __repr__(self):
+		return '<RetryBudget balance={0:.2f}>'.format(self.balance)
+
+	def deposit(self):
+		'''Register a new request.'''
+
+		self._refill()
+		self.balance = min(self.balance + self.ratio, self.max_balance)
+
+	def withdraw(self):
+		'''Take a token for a retry. Returns False if the budget is exhausted.'''
+
+		self._refill()
+
+		if self.balance < 1.0:
+			return False
+
+		self.balance -= 1.0
+		return True
+
+	def _refill(self):
+		now = monotonic()
+		self.balance = min(self.balance + (now - self._last) * self.min_per_second, self.max_balance)
+		self._last = now
+
+
+class RetryPolicy:
+	'''
+	Decides whether and when failed requests are retried.
+
+	Failures are classified as ``server_error`` (5xx), ``rate_limited`` (429), ``connection_reset``, ``dns_failure``
+	or ``timeout``. Each kind has its own maximum amount of attempts in ``attempts``. Everything except rate limits
+	(which are waited out by the :class:`RateLimiter`) backs off exponentially with full jitter and takes a token
+	from the shared :class:`RetryBudget`.
+
+	retries: Counter
+		Retries made, per failure kind.
+	delays: Counter
+		Total seconds slept before retrying, per failure kind.
+	gave_up: Counter
+		Requests that failed after running out of attempts, per failure kind.
+	budget_exhausted: int
+		Retries that were skipped because the retry budget ran dry.
+	'''
+
+	default_attempts = {
+		SERVER_ERROR: 5,
+		RATE_LIMITED: 5,
+		CONNECTION_RESET: 3,
+		DNS_FAILURE: 2,
+		TIMEOUT: 3,
+	}
+
+	def __init__(self, attempts=None, base=0.25, cap=30.0, budget=None):
+		self.attempts = dict(self.default_attempts)
+		if attempts is not None:
+			self.attempts.update(attempts)
+
+		self.base = base
+		self.cap = cap
+		self.budget = RetryBudget() if budget is None else budget
+
+		self.retries = Counter()
+		self.delays = Counter()
+		self.gave_up = Counter()
+		self.budget_exhausted = 0
+
+	def __repr__(self):
+		return '<RetryPolicy retries={0} gave_up={1}>'.format(dict(self.retries), dict(self.gave_up))
+
+	@staticmethod
+	def classify(exc):
+		'''Get the failure kind of an exception raised while sending a request, or None if it should not be retried.'''
+
+		# ServerTimeoutError is also a ClientConnectionError, so check timeouts first
+		if isinstance(exc, asyncio.TimeoutError):
+			return TIMEOUT
+
+		if isinstance(exc, ClientConnectorError) and isinstance(exc.os_error, socket.gaierror):
+			return DNS_FAILURE
+
+		if isinstance(exc, (ClientConnectionError, ClientPayloadError)):
+			return CONNECTION_RESET
+
+		return None
+
+	def delay(self, attempt):
+		'''Full jitter delay before retry number ``attempt``, counting from zero.'''
+
+		return uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+	def should_retry(self, kind, attempt):
+		'''Whether a request that failed with ``kind`` on ``attempt`` (counting from zero) should be tried again.'''
+
+		if attempt + 1 >= self.attempts.get(kind, 1):
+			self.gave_up[kind] += 1
+			return False
+
+		if kind != RATE_LIMITED and not self.budget.withdraw():
+			self.budget_exhausted += 1
+			self.gave_up[kind] += 1
+			log.warning('Retry budget exhausted, not retrying after %s.', kind)
+			return False
+
+		self.retries[kind] += 1
+		return True
+
+	async def backoff(self, kind, attempt, route):
+		'''Sleep before retrying ``route``.'''
+
+		if kind == RATE_LIMITED:
+			return
+
+		delay = self.delay(attempt)
+		self.delays[kind] += delay
+
+		log.info('%s on %r, retrying in %.2f seconds (attempt %s).', kind, route, delay, attempt + 1)
+		await sleep(delay)
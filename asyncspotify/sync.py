@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from json import JSONDecodeError, dumps, loads
+from os import makedirs, remove, replace
+from os.path import isfile, join
+from tempfile import NamedTemporaryFile
+
+from .mixins import valid_item
+from .track import PlaylistTrack
+
+log = logging.getLogger(__name__)
+
+
+def item_key(item):
+	'''What identifies a playlist item in its place: when it was added and what it is.'''
+
+	track = item.get('track') or {}
+	return item.get('added_at'), track.get('uri')
+
+
+class PlaylistState:
+	'''
+	A playlist as it was when it was last synced with :meth:`Client.sync_playlist`.
+
+	playlist_id: str
+		Spotify ID of the playlist.
+	snapshot_id: str
+		Snapshot of the playlist the items are from.
+	items: List[dict]
+		The playlist items, as returned by the API.
+	changed: bool
+		Whether the last sync found the playlist changed.
+	fetched: int
+		How many items the last sync had to fetch.
+	'''
+
+	def __init__(self, playlist_id, snapshot_id=None, items=None):
+		self.playlist_id = playlist_id
+		self.snapshot_id = snapshot_id
+		self.items = items or []
+
+		self.changed = False
+		self.fetched = 0
+
+	def __repr__(self):
+		return '<PlaylistState playlist_id={0.playlist_id!r} snapshot_id={0.snapshot_id!r} total={0.total}>'.format(self)
+
+	@property
+	def total(self):
+		return len(self.items)
+
+	@classmethod
+	def from_data(cls, data):
+		return cls(data['playlist_id'], data['snapshot_id'], data['items'])
+
+	def to_dict(self):
+		return dict(
+			playlist_id=self.playlist_id,
+			snapshot_id=self.snapshot_id,
+			items=self.items,
+		)
+
+	def tracks(self, client):
+		'''Build the items into a list of :class:`PlaylistTrack`.'''
+
+		return [PlaylistTrack(client, item) for item in self.items if valid_item(item)]
+
+
+class PlaylistStorage:
+	'''
+	Base class for keeping playlist states between syncs.
+
+	Subclass this and implement load(playlist_id) and store(state), or use :class:`JSONPlaylistStorage`.
+	'''
+
+	async def load(self, playlist_id):
+		'''Get the stored :class:`PlaylistState` of a playlist, or None if there is none.'''
+
+		raise NotImplementedError
+
+	async def store(self, state):
+		'''Store a :class:`PlaylistState`.'''
+
+		raise NotImplementedError
+
+
+class JSONPlaylistStorage(PlaylistStorage):
+	'''
+	Stores playlist states as one JSON file per playlist.
+
+	directory: str
+		Directory the files are kept in.
+	'''
+
+	def __init__(self, directory='playlists'):
+		self.directory = directory
+
+	def _path(self, playlist_id):
+		return join(self.directory, '{0}.json'.format(playlist_id))
+
+	async def load(self, playlist_id):
+		data = await asyncio.get_event_loop().run_in_executor(None, self._read, self._path(playlist_id))
+		return None if data is None else PlaylistState.from_data(data)
+
+	async def store(self, state):
+		body = dumps(state.to_dict())
+		await asyncio.get_event_loop().run_in_executor(None, self._write, self._path(state.playlist_id), body)
+
+	def _read(self, path):
+		if not isfile(path):
+			return None
+
+		with open(path, 'r') as f:
+			try:
+				return loads(f.read())
+			except JSONDecodeError:
+				log.warning('Ignoring unreadable playlist state in %s', path)
+				return None
+
+	def _write(self, path, body):
+		makedirs(self.directory, exist_ok=True)
+
+		# write next to the old state and swap it in, so a crash never leaves a half written file behind
+		f = NamedTemporaryFile('w', dir=self.directory, suffix='.tmp', delete=False)
+
+		try:
+			with f:
+				f.write(body)
+			replace(f.name, path)
+		except BaseException:
+			remove(f.name)
+			raise
@@ -2,36 +2,43 @@ from datetime import datetime, timedelta
 
 from .audioanalysis import AudioAnalysis
 from .audiofeatures import AudioFeatures
-from .mixins import ArtistMixin, ExternalIDMixin, ExternalURLMixin
-from .object import SpotifyObject
+from .mixins import ArtistMixin, ExternalIDMixin, ExternalURLMixin, shared_markets
+from .object import SpotifyObject, copied_value
 
 
 class _BaseTrack(SpotifyObject, ExternalURLMixin, ArtistMixin):
+	__slots__ = (
+		'external_urls', 'link', 'artists', 'available_markets', 'disc_number', 'explicit', 'preview_url',
+		'track_number', 'is_local', 'is_playable', 'duration',
+	)
+
 	_type = 'track'
 
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
 		ExternalURLMixin.__init__(self, data)
-		ArtistMixin.__init__(self, data)
 
-		self.available_markets = data.pop('available_markets', None)
-		self.disc_number = data.pop('disc_number')
-		self.explicit = data.pop('explicit')
-		self.preview_url = data.pop('preview_url')
-		self.track_number = data.pop('track_number')
-		self.is_local = data.pop('is_local')
+		self.available_markets = shared_markets(data.get('available_markets', None))
+		self.disc_number = data.get('disc_number', None)
+		self.explicit = data.get('explicit', None)
+		self.preview_url = data.get('preview_url', None)
+		self.track_number = data.get('track_number', None)
+		self.is_local = data.get('is_local', None)
+		self.is_playable = data.get('is_playable', None)
 
-		self.duration = timedelta(milliseconds=data.pop('duration_ms'))
+	def _decode_duration(self, data):
+		duration_ms = data.get('duration_ms', None)
+		return None if duration_ms is None else timedelta(milliseconds=duration_ms)
 
 	def avaliable_in(self, market):
 		'''
 		Check if track is available in a market.
 
 		:param market: ISO-3166-1_ value.
-		:return:
+		:return: bool, False if the available markets are not known, like for tracks fetched with a market.
 		'''
-		return market in self.available_markets
+		return self.available_markets is not None and market in self.available_markets
 
 	async def audio_features(self) -> AudioFeatures:
 		'''
@@ -52,6 +59,18 @@ class _BaseTrack(SpotifyObject, ExternalURLMixin, ArtistMixin):
 		'''
 		return await self._client.get_audio_analysis(self.id)
 
+	async def full(self):
+		'''
+		Get the complete version of this track. Lookups made close together are batched if the client has a ``batch_window``.
+
+		:return: :class:`FullTrack`, itself if it already is one.
+		'''
+
+		if isinstance(self, FullTrack):
+			return self
+
+		return await self._client.get_track(self.id)
+
 
 class SimpleTrack(_BaseTrack):
 	'''
@@ -71,18 +90,18 @@ class SimpleTrack(_BaseTrack):
 		Spotify URL of the album.
 	type: str
 		Plaintext string of object type: ``track``.
-	available_markets: List[str] or None
-		Markets where the album is available in ISO-3166-1_ form.
+	available_markets: Tuple[str] or None
+		Markets where the album is available in ISO-3166-1_ form. None when a market was passed.
 	disc_number: int
 		What disc the track appears on. Usually ``1`` unless there are several discs in the album.
 	duration: `timedelta <https://docs.python.org/3/library/datetime.html#timedelta-objects>`_
 		timedelta instance representing the length of the track.
 	explicit: bool
 		Whether the track is explicit or not.
-	external_urls: dict
-		Dictionary that maps type to url.
-	is_playable: bool
-		tbc
+	external_urls: Mapping[str, str]
+		Read only mapping of type to url.
+	is_playable: bool or None
+		Whether the track is playable in the market asked for. Only set when a market was passed.
 	linked_from: :class:`LinkedTrack`
 		tbc
 	restrictions: restrictions object
@@ -95,6 +114,8 @@ class SimpleTrack(_BaseTrack):
 		Whether the track is from a local file.
 	'''
 
+	__slots__ = ()
+
 
 class FullTrack(_BaseTrack, ExternalIDMixin):
 	'''
@@ -106,19 +127,24 @@ class FullTrack(_BaseTrack, ExternalIDMixin):
 		An instance of the album the track appears on.
 	popularity: int
 		An indicator of the popularity of the track, 0 being least popular and 100 being the most.
-	external_ids: dict
-		Dictionary of external IDs.
+	external_ids: Mapping[str, str]
+		Read only mapping of external IDs.
 	'''
 
+	__slots__ = ('external_ids', 'popularity', 'album')
+
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
 		ExternalIDMixin.__init__(self, data)
 
-		self.popularity = data.pop('popularity')
+		self.popularity = data.get('popularity', None)
 
+	def _decode_album(self, data):
 		from .album import SimpleAlbum
-		self.album = SimpleAlbum(client, data.pop('album'))
+
+		album = data.get('album', None)
+		return None if album is None else SimpleAlbum(self._client, album)
 
 
 class PlaylistTrack(FullTrack):
@@ -133,8 +159,14 @@ class PlaylistTrack(FullTrack):
 		Indicates who added the track to the playlist. The information provided from the API is not enough to instantiate a PublicUser object, so it's a plain copy of the returned json object.
 	'''
 
+	__slots__ = ('added_at', 'added_by')
+
 	def __init__(self, client, data):
-		super().__init__(client, data.pop('track'))
+		# added_at is decoded along with the track, so it goes in with a shallow copy of it
+		super().__init__(client, dict(data.get('track', None) or {}, added_at=data.get('added_at', None)))
+
+		self.added_by = copied_value(data.get('added_by', None))
 
-		self.added_at = datetime.strptime(data.pop('added_at'), "%Y-%m-%dT%H:%M:%SZ")
-		self.added_by = data.pop('added_by')
+	def _decode_added_at(self, data):
+		added_at = data.get('added_at', None)
+		return None if added_at is None else datetime.strptime(added_at, "%Y-%m-%dT%H:%M:%SZ")
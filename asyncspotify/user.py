@@ -3,15 +3,16 @@ from .object import SpotifyObject
 
 
 class _BaseUser(SpotifyObject, ExternalURLMixin, ImageMixin):
+	__slots__ = ('external_urls', 'link', 'images', 'display_name', 'follower_count')
+
 	_type = 'user'
 
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
 		ExternalURLMixin.__init__(self, data)
-		ImageMixin.__init__(self, data)
 
-		self.display_name = data.pop('display_name')
+		self.display_name = data.get('display_name', None)
 		self.name = self.display_name
 
 		followers = data.get('followers', None)
@@ -43,10 +44,12 @@ class PublicUser(_BaseUser):
 		Spotify URL of the user.
 	follower_count: int or None
 		Follower count of the user.
-	external_urls: dict
-		Dictionary that maps type to url.
+	external_urls: Mapping[str, str]
+		Read only mapping of type to url.
 	'''
 
+	__slots__ = ()
+
 
 class PrivateUser(_BaseUser):
 	'''
@@ -62,15 +65,17 @@ class PrivateUser(_BaseUser):
 		Users Spotify subscription level, could be ``free``, ``open`` or ``premium``. ``free`` and ``open`` are synonyms.
 	'''
 
+	__slots__ = ('country', 'email', 'product')
+
 	def __init__(self, client, data):
 		super().__init__(client, data)
 
 		# this seems to have been removed from the api listing?
-		#self.birthdate = data.pop('birthdate', None)
+		#self.birthdate = data.get('birthdate', None)
 
-		self.country = data.pop('country', None)
-		self.email = data.pop('email', None)
-		self.product = data.pop('product', None)
+		self.country = data.get('country', None)
+		self.email = data.get('email', None)
+		self.product = data.get('product', None)
 
 	async def top_tracks(self, limit=20, offset=None, time_range=None):
 		'''
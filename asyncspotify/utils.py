@@ -37,7 +37,7 @@ def subslice(iter, step):
 		if idx % step == 0:
 			if group:
 				yield group
-				group.clear()
+				group = []
 
 		group.append(item)
 
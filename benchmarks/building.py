@@ -0,0 +1,58 @@
+'''
+Compares the time spent building models against decoding their JSON, eagerly and in lazy mode.
+
+Building is measured for a playlist of 10,000 tracks, both on its own and followed by reading one attribute that
+lazy mode has to decode.
+
+Run with ``python benchmarks/building.py``.
+'''
+
+import json
+import os
+import sys
+from timeit import repeat
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tests'))
+
+import payloads
+from asyncspotify import PlaylistTrack
+
+COUNT = 10000
+
+
+def best_of(func, number=3):
+	return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+	body = json.dumps([payloads.playlist_track() for _ in range(COUNT)]).encode()
+
+	def build(lazy, read=None):
+		client = SimpleNamespace(prefetch=0, parallel_paging=False, lazy=lazy)
+
+		def run():
+			tracks = [PlaylistTrack(client, item) for item in json.loads(body)]
+			if read is not None:
+				for track in tracks:
+					getattr(track, read)
+
+		return run
+
+	decoding = best_of(lambda: json.loads(body))
+	print('{0} playlist tracks, {1:.1f} MiB'.format(COUNT, len(body) / 1024 / 1024))
+	print('  {0:<34}{1:>10.1f} ms'.format('decoding', decoding * 1000))
+
+	for name, func in (
+		('decoding + building', build(False)),
+		('decoding + building (lazy)', build(True)),
+		('... reading added_at (lazy)', build(True, 'added_at')),
+		('... reading artists (lazy)', build(True, 'artists')),
+	):
+		took = best_of(func)
+		print('  {0:<34}{1:>10.1f} ms  {2:>5.2f}x decoding'.format(name, took * 1000, took / decoding))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,60 @@
+'''
+Compares decoding response bodies the old way (``text()`` then ``json.loads``) against decoding the raw bytes
+with each available decoder, per endpoint.
+
+Run with ``python benchmarks/decoding.py``.
+'''
+
+import json
+import os
+import sys
+from timeit import repeat
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tests'))
+
+import payloads
+from asyncspotify.decoders import msgspec_decoder, orjson_decoder, stdlib_decoder
+
+ENDPOINTS = (
+	('GET playlists/{id}/tracks (100 items)', payloads.playlist_tracks_page),
+	('GET tracks?ids= (50 tracks)', payloads.several_tracks),
+	('GET albums/{id}', payloads.full_album),
+	('GET audio-analysis/{id}', payloads.audio_analysis),
+)
+
+
+def text_then_loads(body):
+	# what ClientResponse.text() followed by json.loads amounts to
+	return json.loads(body.decode('utf-8'))
+
+
+def best_of(func, body, number):
+	return min(repeat(lambda: func(body), number=number, repeat=5)) / number
+
+
+def main():
+	decoders = [('stdlib (bytes)', stdlib_decoder)]
+	if orjson_decoder is not None:
+		decoders.append(('orjson', orjson_decoder))
+	if msgspec_decoder is not None:
+		decoders.append(('msgspec', msgspec_decoder))
+
+	for name, make in ENDPOINTS:
+		body = json.dumps(make()).encode()
+		number = max(1, 2000000 // len(body))
+
+		baseline = best_of(text_then_loads, body, number)
+
+		print('{0} - {1:.1f} KiB'.format(name, len(body) / 1024))
+		print('  {0:<16}{1:>10.3f} ms'.format('text + loads', baseline * 1000))
+
+		for decoder_name, decoder in decoders:
+			took = best_of(decoder, body, number)
+			print('  {0:<16}{1:>10.3f} ms  {2:>5.2f}x'.format(decoder_name, took * 1000, baseline / took))
+
+		print()
+
+
+if __name__ == '__main__':
+	main()
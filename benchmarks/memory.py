@@ -0,0 +1,68 @@
+'''
+Measures how many bytes a model keeps alive, per model, after building it from a decoded response.
+
+Everything the models hold on to is counted, including the strings taken over from the payload. Tracks are measured
+both as returned without a market, and with one, where Spotify leaves out ``available_markets``.
+
+Run with ``python benchmarks/memory.py``.
+'''
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tests'))
+
+import payloads
+from asyncspotify import FullTrack, PlaylistTrack, SimpleArtist
+
+COUNT = 5000
+
+client = SimpleNamespace(prefetch=0, parallel_paging=False)
+
+
+def without_markets(make):
+	def wrapped():
+		data = make()
+		data.pop('available_markets', None)
+		data.get('album', {}).pop('available_markets', None)
+		return data
+
+	return wrapped
+
+
+MODELS = (
+	('FullTrack', FullTrack, payloads.full_track),
+	('FullTrack (market)', FullTrack, without_markets(payloads.full_track)),
+	('PlaylistTrack', PlaylistTrack, payloads.playlist_track),
+	('SimpleArtist', SimpleArtist, payloads.simple_artist),
+)
+
+
+def measure(cls, make):
+	body = json.dumps([make() for _ in range(COUNT)]).encode()
+
+	gc.collect()
+	tracemalloc.start()
+
+	models = [cls(client, data) for data in json.loads(body)]
+
+	gc.collect()
+	size, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	assert len(models) == COUNT
+	return size / COUNT
+
+
+def main():
+	for name, cls, make in MODELS:
+		print('{0:<20}{1:>10.0f} bytes'.format(name, measure(cls, make)))
+
+
+if __name__ == '__main__':
+	main()
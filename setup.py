@@ -16,6 +16,9 @@ setuptools.setup(
     long_description_content_type="text/x-rst",
     keywords='spotify async aio asyncio api webapi',
     install_requires=install_requires,
+    extras_require={
+        'speedups': ['orjson'],
+    },
     url="https://github.com/Run1e/asyncspotify",
     project_urls={
         'Documentation': 'https://asyncspotify.rtfd.io/'
@@ -23,8 +26,14 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     classifiers=[
         "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
+        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.5.2"  # first version to support async class generator iterators
+    python_requires=">=3.7"  # first version with contextlib.asynccontextmanager
 )
\ No newline at end of file
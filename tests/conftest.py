@@ -1,10 +1,40 @@
-import asyncio
-
-import pytest
-
-
-@pytest.yield_fixture(scope='session')
-def event_loop():
-	loop = asyncio.get_event_loop()
-	yield loop
-	loop.close()
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from asyncspotify import Client, ClientCredentialsFlow
+from asyncspotify.oauth.response import AuthenticationResponse
+from fakes import CatalogServer, FakeSession
+
+
+@pytest.yield_fixture(scope='session')
+def event_loop():
+	loop = asyncio.get_event_loop()
+	yield loop
+	loop.close()
+
+
+@pytest.fixture
+def catalog_server():
+	return CatalogServer()
+
+
+@pytest_asyncio.fixture
+async def make_client():
+	'''Make authorized clients answered by a responder instead of the network, closing them afterwards.'''
+
+	clients = []
+
+	async def make(responder, **kwargs):
+		client = Client(ClientCredentialsFlow('id', 'secret'), **kwargs)
+		await client.http.session.close()
+		client.http.session = FakeSession(responder)
+		client.auth._data = AuthenticationResponse(dict(access_token='token', token_type='Bearer', expires_in=3600))
+		clients.append(client)
+		return client
+
+	yield make
+
+	for client in clients:
+		await client.close()
@@ -0,0 +1,120 @@
+'''Stand-ins for the Spotify API used by the tests, answering requests without the network.'''
+
+import asyncio
+from json import dumps
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeResponse:
+	def __init__(self, status=200, body=None, headers=None):
+		self.status = status
+		self.reason = 'Fake'
+		self.headers = headers or {}
+		self._body = b'' if body is None else dumps(body).encode()
+
+	async def text(self):
+		return self._body.decode()
+
+	async def read(self):
+		return self._body
+
+
+class FakeSession:
+	'''Replays queued responses (or a responder callable) and keeps track of concurrency.'''
+
+	def __init__(self, responder=None, delay=0.0):
+		self.responder = responder or (lambda kw: FakeResponse(body=dict(ok=True)))
+		self.delay = delay
+		self.calls = []
+		self.in_flight = 0
+		self.max_in_flight = 0
+
+	def request(self, **kw):
+		session = self
+
+		class _Context:
+			async def __aenter__(self):
+				session.calls.append(kw)
+				session.in_flight += 1
+				session.max_in_flight = max(session.max_in_flight, session.in_flight)
+				try:
+					await asyncio.sleep(session.delay)
+				finally:
+					session.in_flight -= 1
+				resp = session.responder(kw)
+				if isinstance(resp, BaseException):
+					raise resp
+				return resp
+
+			async def __aexit__(self, *exc):
+				pass
+
+		return _Context()
+
+	async def close(self):
+		pass
+
+
+def item(n):
+	return dict(added_at='2020-01-01T00:00:{0:02}Z'.format(n % 60), track=dict(id=str(n), uri='spotify:track:{0}'.format(n)))
+
+
+class PlaylistServer:
+	'''Serves a single playlist, whose snapshot changes whenever its items do.'''
+
+	item = staticmethod(item)
+
+	def __init__(self, count):
+		self.items = [item(n) for n in range(count)]
+		self.requested = []
+
+	@property
+	def snapshot_id(self):
+		return str(hash(tuple(entry['track']['uri'] for entry in self.items)))
+
+	def __call__(self, kw):
+		parts = urlsplit(kw['url'])
+		query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+		query.update(kw.get('params') or {})
+
+		if parts.path.endswith('/tracks'):
+			offset, limit = int(query.get('offset', 0)), int(query.get('limit', 20))
+			end = offset + limit
+			self.requested.append((offset, limit))
+			return FakeResponse(body=dict(
+				href=kw['url'], items=self.items[offset:end], limit=limit, offset=offset, total=len(self.items),
+				next='{0}?offset={1}&limit={2}'.format(parts.path, end, limit) if end < len(self.items) else None,
+				previous=None,
+			))
+
+		return FakeResponse(body=dict(snapshot_id=self.snapshot_id, tracks=dict(total=len(self.items))))
+
+
+class CatalogServer:
+	'''
+	Serves tracks, albums and artists by id, both one at a time and several at once.
+
+	Objects are made by ``make(type, id)``, and ids starting with ``missing`` don't exist. Requests are recorded in
+	``requested``, as ``(type, id)`` for single lookups and ``(type, ids)`` for several.
+	'''
+
+	def __init__(self, make=None):
+		self.make = make or (lambda type, id: dict(id=id, name=id, type=type[:-1], popularity=50))
+		self.requested = []
+
+	def find(self, type, id):
+		return None if id.startswith('missing') else self.make(type, id)
+
+	def __call__(self, kw):
+		path = urlsplit(kw['url']).path.split('/v1/', 1)[1]
+		params = kw.get('params') or {}
+
+		if 'ids' in params:
+			ids = params['ids'].split(',')
+			self.requested.append((path, ids))
+			return FakeResponse(body={path: [self.find(path, id) for id in ids]})
+
+		type, id = path.rsplit('/', 1)
+		self.requested.append((type, id))
+		obj = self.find(type, id)
+		return FakeResponse(404, dict(error=dict(status=404, message='not found'))) if obj is None else FakeResponse(body=obj)
@@ -0,0 +1,123 @@
+'''Synthetic API payloads shaped like real Spotify responses, used by the tests and the benchmarks.'''
+
+import string
+from random import Random
+
+MARKETS = [a + b for a in string.ascii_uppercase[:14] for b in string.ascii_uppercase[:13]][:180]
+
+_random = Random(1234)
+
+
+def spotify_id():
+	return ''.join(_random.choice(string.ascii_letters + string.digits) for _ in range(22))
+
+
+def external_urls(type, id):
+	return dict(spotify='https://open.spotify.com/{0}/{1}'.format(type, id))
+
+
+def image(size):
+	return dict(url='https://i.scdn.co/image/' + spotify_id(), width=size, height=size)
+
+
+def simple_artist():
+	id = spotify_id()
+	return dict(
+		id=id, name='Artist ' + id[:5], type='artist', uri='spotify:artist:' + id,
+		href='https://api.spotify.com/v1/artists/' + id, external_urls=external_urls('artist', id),
+	)
+
+
+def simple_album():
+	id = spotify_id()
+	return dict(
+		id=id, name='Album ' + id[:5], type='album', uri='spotify:album:' + id,
+		href='https://api.spotify.com/v1/albums/' + id, external_urls=external_urls('album', id),
+		album_type='album', artists=[simple_artist()], available_markets=list(MARKETS),
+		images=[image(640), image(300), image(64)], release_date='2019-05-17', release_date_precision='day',
+		total_tracks=12,
+	)
+
+
+def full_track():
+	id = spotify_id()
+	return dict(
+		id=id, name='Track ' + id[:5], type='track', uri='spotify:track:' + id,
+		href='https://api.spotify.com/v1/tracks/' + id, external_urls=external_urls('track', id),
+		external_ids=dict(isrc='US' + id[:10].upper()), album=simple_album(),
+		artists=[simple_artist(), simple_artist()], available_markets=list(MARKETS), disc_number=1,
+		duration_ms=_random.randint(120000, 360000), explicit=False, is_local=False, popularity=_random.randint(0, 100),
+		preview_url='https://p.scdn.co/mp3-preview/' + id, track_number=_random.randint(1, 12),
+	)
+
+
+def user():
+	id = spotify_id()
+	return dict(
+		id=id, display_name=id[:8], type='user', uri='spotify:user:' + id,
+		href='https://api.spotify.com/v1/users/' + id, external_urls=external_urls('user', id),
+	)
+
+
+def playlist_track():
+	return dict(added_at='2020-01-01T12:00:00Z', added_by=user(), is_local=False, track=full_track())
+
+
+def paging(items, limit, offset=0, total=None):
+	return dict(
+		href='https://api.spotify.com/v1/playlists/x/tracks?offset={0}&limit={1}'.format(offset, limit),
+		items=items, limit=limit, next=None, offset=offset, previous=None,
+		total=len(items) if total is None else total,
+	)
+
+
+def playlist_tracks_page(size=100):
+	return paging([playlist_track() for _ in range(size)], size)
+
+
+def several_tracks(size=50):
+	return dict(tracks=[full_track() for _ in range(size)])
+
+
+def full_album(tracks=20):
+	album = simple_album()
+	album.update(
+		copyrights=[dict(text='(C) Label', type='C')], external_ids=dict(upc='0000000000'),
+		genres=[], label='Label', popularity=50,
+		tracks=paging([dict(full_track(), album=None) for _ in range(tracks)], 50),
+	)
+	return album
+
+
+def audio_analysis(segments=3000):
+	def interval(i):
+		return dict(start=i * 0.5, duration=0.5, confidence=_random.random())
+
+	def section(i):
+		return dict(
+			start=i * 20.0, duration=20.0, confidence=1.0, loudness=-8.0, tempo=120.0, tempo_confidence=0.5,
+			key=5, key_confidence=0.5, mode=1, mode_confidence=0.5, time_signature=4, time_signature_confidence=1.0,
+		)
+
+	def segment(i):
+		return dict(
+			start=i * 0.1, duration=0.1, confidence=_random.random(), loudness_start=-20.0, loudness_max=-10.0,
+			loudness_max_time=0.05, loudness_end=0.0, pitches=[_random.random() for _ in range(12)],
+			timbre=[_random.random() * 100 for _ in range(12)],
+		)
+
+	return dict(
+		bars=[interval(i) for i in range(segments // 20)],
+		beats=[interval(i) for i in range(segments // 5)],
+		tatums=[interval(i) for i in range(segments // 3)],
+		sections=[section(i) for i in range(12)],
+		segments=[segment(i) for i in range(segments)],
+		track=dict(
+			duration=240.0, sample_md5='', offset_seconds=0, window_seconds=0, analysis_sample_rate=22050,
+			analysis_channels=1, end_of_fade_in=0.0, start_of_fade_out=235.0, loudness=-8.0, tempo=120.0,
+			tempo_confidence=0.5, time_signature=4, time_signature_confidence=1.0, key=5, key_confidence=0.5,
+			mode=1, mode_confidence=0.5, codestring='x' * 2000, code_version=3.15, echoprintstring='x' * 2000,
+			echoprint_version=4.12, synchstring='x' * 200, synch_version=1.0, rhythmstring='x' * 2000,
+			rhythm_version=1.0, num_samples=5000000,
+		),
+	)
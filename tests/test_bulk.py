@@ -0,0 +1,180 @@
+import asyncio
+
+from pytest import mark
+
+from asyncspotify import FullAlbum, FullArtist, FullTrack, NotFound, SimpleAlbum, SimpleArtist, SimpleTrack
+from asyncspotify.bulk import batch_limit, fetch_several
+
+from fakes import FakeResponse
+
+pytestmark = mark.asyncio
+
+FEATURES = dict(
+	type='audio_features', acousticness=0.5, analysis_url='', danceability=0.5, duration_ms=200000, energy=0.5,
+	instrumentalness=0.0, key=5, liveness=0.1, loudness=-8.0, mode=1, speechiness=0.1, tempo=120.0, time_signature=4,
+	track_href='', valence=0.5,
+)
+
+
+class FakeEndpoint:
+	'''Answers several items requests, with None for ids starting with ``missing``.'''
+
+	def __init__(self, key, delay=0.01):
+		self.key = key
+		self.delay = delay
+		self.requested = []
+		self.in_flight = 0
+		self.max_in_flight = 0
+
+	async def __call__(self, ids, **params):
+		ids = ids.split(',')
+		self.requested.append(ids)
+		self.in_flight += 1
+		self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+		try:
+			await asyncio.sleep(self.delay)
+		finally:
+			self.in_flight -= 1
+
+		return {self.key: [None if id.startswith('missing') else dict(id=id, params=params) for id in ids]}
+
+
+class TestBulk:
+	async def test_batch_limit(self):
+		assert batch_limit('tracks') == 50
+		assert batch_limit('albums') == 20
+		assert batch_limit('artists') == 50
+		assert batch_limit('audio-features') == 100
+
+	async def test_chunks_concurrently(self):
+		fetch = FakeEndpoint('audio_features')
+		ids = ['t{0}'.format(n) for n in range(250)]
+		found = await fetch_several(fetch, 'audio-features', ids)
+
+		assert [len(chunk) for chunk in fetch.requested] == [100, 100, 50]
+		assert fetch.max_in_flight == 3
+		assert list(found) == ids
+
+	async def test_deduplicates(self):
+		fetch = FakeEndpoint('albums')
+		found = await fetch_several(fetch, 'albums', ['a', 'b', 'a', 'c', 'b'], market='SE')
+
+		assert fetch.requested == [['a', 'b', 'c']]
+		assert found['a'] == dict(id='a', params=dict(market='SE'))
+
+	async def test_missing(self):
+		fetch = FakeEndpoint('artists')
+		found = await fetch_several(fetch, 'artists', ['a', 'missing', 'b'])
+
+		assert found['missing'] is None and found['b']['id'] == 'b'
+
+	async def test_nothing_to_fetch(self):
+		fetch = FakeEndpoint('tracks')
+
+		assert await fetch_several(fetch, 'tracks', []) == {}
+		assert fetch.requested == []
+
+
+class TestClientBulk:
+	async def test_order_and_missing(self, make_client):
+		requested = []
+
+		def responder(kw):
+			ids = kw['params']['ids'].split(',')
+			requested.append(ids)
+			artists = [None if id == 'missing' else dict(id=id, name=id, type='artist') for id in ids]
+			return FakeResponse(body=dict(artists=artists))
+
+		client = await make_client(responder)
+
+		ids = ['a{0}'.format(n) for n in range(60)]
+		artists = await client.get_artists(*ids, 'missing', ids[0])
+
+		assert [len(chunk) for chunk in requested] == [50, 11]
+		assert [artist.id for artist in artists[:60]] == ids
+		assert artists[60] is None
+		assert artists[61] is artists[0]
+
+	async def test_audio_features_comma_separated(self, make_client):
+		def responder(kw):
+			ids = kw['params']['ids'].split(',')
+			return FakeResponse(body=dict(audio_features=[dict(FEATURES, id=id) for id in ids]))
+
+		client = await make_client(responder)
+
+		features = await client.get_audio_features_multiple_tracks(','.join('t{0}'.format(n) for n in range(150)))
+
+		assert len(client.http.session.calls) == 2
+		assert features[-1].id == 't149'
+
+
+class TestBatchLoader:
+	async def test_batches_lookups(self, make_client, catalog_server):
+		client = await make_client(catalog_server, batch_window=0)
+
+		ids = ['t{0}'.format(n) for n in range(120)]
+		tracks = await asyncio.gather(*(client.get_track(id) for id in ids + ids[:5]))
+
+		assert [len(ids) for _, ids in catalog_server.requested] == [50, 50, 20]
+		assert [track.id for track in tracks] == ids + ids[:5]
+		assert tracks[0] is not tracks[120]
+		assert client.loader.batches == 1
+
+	async def test_missing_falls_back(self, make_client, catalog_server):
+		client = await make_client(catalog_server, batch_window=0.01)
+
+		found, missing = await asyncio.gather(client.get_track('a'), client.get_track('missing'), return_exceptions=True)
+
+		assert found.id == 'a'
+		assert isinstance(missing, NotFound)
+		assert catalog_server.requested == [('tracks', ['a', 'missing']), ('tracks', 'missing')]
+
+	async def test_off_by_default(self, make_client, catalog_server):
+		client = await make_client(catalog_server)
+
+		await asyncio.gather(client.get_track('a'), client.get_track('b'))
+
+		assert sorted(catalog_server.requested) == [('tracks', 'a'), ('tracks', 'b')]
+
+
+class TestHydrate:
+	async def test_hydrate_mixed(self, make_client, catalog_server):
+		client = await make_client(catalog_server)
+
+		tracks = [SimpleTrack(client, dict(id='t{0}'.format(n))) for n in range(60)]
+		objects = tracks + [
+			SimpleAlbum(client, dict(id='al')), SimpleArtist(client, dict(id='ar')), 'unrelated',
+			SimpleArtist(client, dict(id='missing')), tracks[0],
+		]
+
+		hydrated = await client.hydrate(objects)
+
+		assert sorted((path, len(ids)) for path, ids in catalog_server.requested) == [
+			('albums', 1), ('artists', 2), ('tracks', 10), ('tracks', 50)
+		]
+		assert all(isinstance(track, FullTrack) for track in hydrated[:60])
+		assert [track.id for track in hydrated[:60]] == [track.id for track in tracks]
+		assert isinstance(hydrated[60], FullAlbum) and isinstance(hydrated[61], FullArtist)
+		assert hydrated[62] == 'unrelated'
+		assert hydrated[63] is objects[63]
+		assert hydrated[64] is hydrated[0]
+
+	async def test_full_artists(self, make_client, catalog_server):
+		client = await make_client(catalog_server)
+
+		track = FullTrack(client, dict(id='t', artists=[dict(id='a'), dict(id='b')]))
+		artists = await track.full_artists()
+
+		assert catalog_server.requested == [('artists', ['a', 'b'])]
+		assert all(isinstance(artist, FullArtist) for artist in artists)
+		assert track.artists is artists
+
+	async def test_full(self, make_client, catalog_server):
+		client = await make_client(catalog_server, batch_window=0)
+
+		tracks = [SimpleTrack(client, dict(id=id)) for id in 'abc']
+		full = await asyncio.gather(*(track.full() for track in tracks))
+
+		assert catalog_server.requested == [('tracks', ['a', 'b', 'c'])]
+		assert await full[0].full() is full[0]
@@ -211,6 +211,18 @@ class TestClient:
 		for track in tracks:
 			assert isinstance(track, PlaylistTrack)
 
+	async def test_iter_playlist_tracks(self, sp: Client, good_playlist):
+		tracks = [track async for track in sp.iter_playlist_tracks(good_playlist.id)]
+
+		assert [track.id for track in tracks] == [track.id for track in await sp.get_playlist_tracks(good_playlist.id)]
+
+	async def test_counts(self, sp: Client, good_playlist, good_album_id, good_artist_id, user, query):
+		assert await sp.count_playlist_tracks(good_playlist.id) == len(await sp.get_playlist_tracks(good_playlist.id))
+		assert await sp.count_album_tracks(good_album_id) == len(await sp.get_album_tracks(good_album_id, limit=None))
+		assert await sp.count_artist_albums(good_artist_id) == len(await sp.get_artist_albums(good_artist_id, limit=None))
+		assert await sp.count_user_playlists(user.id) == len(await sp.get_user_playlists(user.id))
+		assert await sp.count_search('track', query) > 0
+
 	async def test_get_user(self, sp: Client, user):
 		fetched = await sp.get_user(user.id)
 		assert fetched.id == user.id
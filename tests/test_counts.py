@@ -0,0 +1,41 @@
+from urllib.parse import urlsplit
+
+from pytest import mark
+
+from fakes import FakeResponse
+
+pytestmark = mark.asyncio
+
+
+class TestCounts:
+	async def test_counts(self, make_client):
+		requested = []
+
+		def responder(kw):
+			path = urlsplit(kw['url']).path.split('/v1/', 1)[1]
+			params = kw['params']
+			requested.append((path, params))
+
+			page = dict(total=42)
+			if path == 'search':
+				return FakeResponse(body={params['type'] + 's': page})
+			if path == 'me/following':
+				return FakeResponse(body=dict(artists=page))
+			return FakeResponse(body=page)
+
+		client = await make_client(responder)
+
+		counts = [
+			await client.count_playlist_tracks('p'),
+			await client.count_album_tracks('a'),
+			await client.count_artist_albums('ar'),
+			await client.count_user_playlists('u'),
+			await client.count_followed_artists(),
+			await client.count_me_top_tracks(),
+			await client.count_me_top_artists(),
+			await client.count_search('track', 'abba'),
+		]
+
+		assert counts == [42] * 8
+		assert all(int(params['limit']) == 1 for path, params in requested)
+		assert requested[0] == ('playlists/p/tracks', dict(limit=1, fields='total'))
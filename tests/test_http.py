@@ -0,0 +1,399 @@
+import asyncio
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from time import monotonic as loop_time
+from types import SimpleNamespace
+
+from aiohttp import ClientConnectorError, ServerDisconnectedError
+from pytest import mark, raises
+
+from asyncspotify import HTTPException, NotFound, ResponseCache, Route
+from asyncspotify.decoders import default_decoder, msgspec_decoder, orjson_decoder, stdlib_decoder
+from asyncspotify.http import HTTP
+from asyncspotify.offload import LagMonitor, Offloader
+from asyncspotify.ratelimit import RateLimiter
+from asyncspotify.retry import CONNECTION_RESET, DNS_FAILURE, SERVER_ERROR, TIMEOUT, RetryBudget, RetryPolicy
+
+from fakes import FakeResponse, FakeSession
+
+pytestmark = mark.asyncio
+
+
+async def make_http(session, **kwargs):
+	client = SimpleNamespace(auth=SimpleNamespace(header=dict(Authorization='Bearer token')))
+	http = HTTP(client, **kwargs)
+	await http.session.close()
+	http.session = session
+	return http
+
+
+class TestConcurrency:
+	async def test_requests_run_concurrently(self):
+		session = FakeSession(delay=0.02)
+		http = await make_http(session, max_concurrency=3)
+
+		await asyncio.gather(*(http.request(Route('GET', 'tracks/{0}'.format(i))) for i in range(9)))
+
+		assert len(session.calls) == 9
+		assert session.max_in_flight == 3
+
+	async def test_route_limits(self):
+		session = FakeSession(delay=0.02)
+		http = await make_http(session, max_concurrency=5, route_limits={'search': 1})
+
+		await asyncio.gather(*(http.request(Route('GET', 'search', q=str(i))) for i in range(4)))
+
+		assert session.max_in_flight == 1
+
+	async def test_route_matching(self):
+		assert Route('GET', 'playlists/abc/tracks').matches('playlists/*/tracks')
+		assert Route('GET', 'https://api.spotify.com/v1/playlists/abc/tracks?offset=100&limit=100').matches('playlists/*/tracks')
+		assert not Route('GET', 'playlists/abc').matches('playlists/*/tracks')
+
+	async def test_status_semantics(self):
+		http = await make_http(FakeSession(lambda kw: FakeResponse(404, dict(error=dict(message='nope')))))
+
+		with raises(NotFound):
+			await http.request(Route('GET', 'tracks/x'))
+
+		http = await make_http(FakeSession(lambda kw: FakeResponse(503)), retry_policy=RetryPolicy(base=0))
+
+		with raises(HTTPException):
+			await http.request(Route('GET', 'tracks/x'))
+
+		assert http.retry_policy.retries[SERVER_ERROR] == 4
+		assert http.retry_policy.gave_up[SERVER_ERROR] == 1
+
+
+class TestRateLimiter:
+	async def test_throttle_pauses_everyone(self):
+		limiter = RateLimiter(max_window=4)
+
+		limiter.throttle(0.1)
+		assert limiter.state == 'paused'
+		assert limiter.window == 2
+
+		# a second 429 from the same burst does not shrink the window again
+		limiter.throttle(0.1)
+		assert limiter.window == 2
+		assert limiter.throttle_count == 1
+
+		start = loop_time()
+		async with limiter:
+			pass
+		assert loop_time() - start >= 0.09
+
+	async def test_window_recovers(self):
+		limiter = RateLimiter(max_window=4)
+		limiter.throttle(0)
+		assert limiter.state == 'recovering'
+
+		for _ in range(20):
+			async with limiter:
+				limiter.success()
+
+		assert limiter.window == 4
+		assert limiter.state == 'open'
+		assert limiter.rate > 0
+
+	async def test_window_bounds_in_flight(self):
+		limiter = RateLimiter(max_window=2)
+		in_flight = []
+
+		async def worker():
+			async with limiter:
+				in_flight.append(limiter.in_flight)
+				await asyncio.sleep(0.01)
+
+		await asyncio.gather(*(worker() for _ in range(6)))
+		assert max(in_flight) == 2
+		assert limiter.in_flight == 0
+
+	async def test_429_is_shared(self):
+		responses = [FakeResponse(429, headers={'Retry-After': '0'})]
+		session = FakeSession(lambda kw: responses.pop() if responses else FakeResponse(body=dict(ok=True)))
+		http = await make_http(session, max_concurrency=4)
+
+		assert await http.request(Route('GET', 'tracks/a')) == dict(ok=True)
+		assert http.ratelimiter.throttle_count == 1
+		assert len(session.calls) == 2
+
+
+class TestRetryPolicy:
+	async def test_classify(self):
+		dns = ClientConnectorError(None, socket.gaierror(-2, 'Name or service not known'))
+		reset = ClientConnectorError(None, ConnectionResetError(104, 'Connection reset by peer'))
+
+		assert RetryPolicy.classify(dns) == DNS_FAILURE
+		assert RetryPolicy.classify(reset) == CONNECTION_RESET
+		assert RetryPolicy.classify(ServerDisconnectedError()) == CONNECTION_RESET
+		assert RetryPolicy.classify(asyncio.TimeoutError()) == TIMEOUT
+		assert RetryPolicy.classify(ValueError()) is None
+
+	async def test_full_jitter(self):
+		policy = RetryPolicy(base=1, cap=5)
+
+		for attempt in range(10):
+			assert 0 <= policy.delay(attempt) <= min(5, 2 ** attempt)
+
+	async def test_connection_errors_are_retried(self):
+		failures = [ServerDisconnectedError(), asyncio.TimeoutError()]
+		session = FakeSession(lambda kw: failures.pop() if failures else FakeResponse(body=dict(ok=True)))
+		http = await make_http(session, retry_policy=RetryPolicy(base=0))
+
+		assert await http.request(Route('GET', 'tracks/a')) == dict(ok=True)
+		assert http.retry_policy.retries[TIMEOUT] == 1
+		assert http.retry_policy.retries[CONNECTION_RESET] == 1
+
+	async def test_exhausted_connection_errors_are_raised(self):
+		session = FakeSession(lambda kw: ServerDisconnectedError())
+		http = await make_http(session, retry_policy=RetryPolicy(base=0))
+
+		with raises(ServerDisconnectedError):
+			await http.request(Route('GET', 'tracks/a'))
+
+		assert len(session.calls) == RetryPolicy.default_attempts[CONNECTION_RESET]
+
+	async def test_budget(self):
+		budget = RetryBudget(ratio=0.5, min_per_second=0, max_balance=1)
+		policy = RetryPolicy(base=0, budget=budget)
+
+		assert policy.should_retry(SERVER_ERROR, 0)
+		assert not policy.should_retry(SERVER_ERROR, 0)
+		assert policy.budget_exhausted == 1
+
+		budget.deposit()
+		budget.deposit()
+		assert policy.should_retry(SERVER_ERROR, 0)
+
+
+class TestCoalescing:
+	async def test_identical_gets_share_a_request(self):
+		session = FakeSession(lambda kw: FakeResponse(body=dict(id='a', nested=dict(x=1))), delay=0.02)
+		http = await make_http(session)
+
+		results = await asyncio.gather(*(http.request(Route('GET', 'artists/a')) for _ in range(5)))
+
+		assert len(session.calls) == 1
+		assert http.coalesced == 4
+		assert all(result == dict(id='a', nested=dict(x=1)) for result in results)
+
+		# models don't modify their payload, so every waiter shares it
+		assert all(result is results[0] for result in results)
+
+	async def test_different_requests_are_not_coalesced(self):
+		session = FakeSession(delay=0.02)
+		http = await make_http(session)
+
+		await asyncio.gather(
+			http.request(Route('GET', 'artists/a')),
+			http.request(Route('GET', 'artists/a', market='SE')),
+			http.request(Route('PUT', 'artists/a')),
+			http.request(Route('PUT', 'artists/a')),
+		)
+
+		assert len(session.calls) == 4
+
+	async def test_errors_reach_every_waiter(self):
+		session = FakeSession(lambda kw: FakeResponse(404), delay=0.02)
+		http = await make_http(session)
+
+		results = await asyncio.gather(*(http.request(Route('GET', 'artists/a')) for _ in range(3)), return_exceptions=True)
+
+		assert len(session.calls) == 1
+		assert all(isinstance(result, NotFound) for result in results)
+
+	async def test_disabled(self):
+		session = FakeSession(delay=0.02)
+		http = await make_http(session, coalesce=False)
+
+		await asyncio.gather(*(http.request(Route('GET', 'artists/a')) for _ in range(3)))
+
+		assert len(session.calls) == 3
+
+
+class TestResponseCache:
+	async def test_catalog_is_cached(self):
+		session = FakeSession(lambda kw: FakeResponse(body=dict(id='a')))
+		cache = ResponseCache()
+		http = await make_http(session, cache=cache)
+
+		first = await http.request(Route('GET', 'tracks/a'))
+		second = await http.request(Route('GET', 'tracks/a'))
+
+		assert first == dict(id='a')
+		assert first is second
+		assert len(session.calls) == 1
+		assert cache.hits == 1
+		assert cache.misses == 1
+
+	async def test_player_is_not_cached(self):
+		session = FakeSession(lambda kw: FakeResponse(body=dict(is_playing=True)))
+		cache = ResponseCache()
+		http = await make_http(session, cache=cache)
+
+		await http.request(Route('GET', 'me/player'))
+		await http.request(Route('GET', 'me/player'))
+
+		assert len(session.calls) == 2
+		assert len(cache) == 0
+		assert cache.ttl(Route('GET', 'me/player/devices')) is not None
+
+	async def test_negative_caching(self):
+		session = FakeSession(lambda kw: FakeResponse(404, dict(error=dict(message='gone'))))
+		http = await make_http(session, cache=ResponseCache())
+
+		for _ in range(3):
+			with raises(NotFound):
+				await http.request(Route('GET', 'albums/a'))
+
+		assert len(session.calls) == 1
+
+	async def test_lru_eviction(self):
+		cache = ResponseCache(max_size=10)
+
+		cache.set('a', 'xxxx', 60)
+		cache.set('b', 'xxxx', 60)
+		assert cache.get('a') is not None
+
+		cache.set('c', 'xxxx', 60)
+
+		assert cache.evictions == 1
+		assert cache.size == 8
+		assert cache.get('b') is None
+		assert cache.get('a') is not None
+		assert cache.get('c') is not None
+
+	async def test_expiry(self):
+		cache = ResponseCache()
+		cache.set('a', 'xxxx', 0)
+
+		assert cache.get('a') is None
+		assert cache.size == 0
+
+
+class TestETags:
+	async def test_revalidation(self):
+		def responder(kw):
+			if kw['headers'].get('If-None-Match') == '"v1"':
+				return FakeResponse(304)
+			return FakeResponse(body=dict(id='p', tracks=[1, 2, 3]), headers={'ETag': '"v1"'})
+
+		session = FakeSession(responder)
+		cache = ResponseCache()
+		http = await make_http(session, cache=cache)
+
+		first = await http.request(Route('GET', 'playlists/p'))
+		second = await http.request(Route('GET', 'playlists/p'))
+
+		assert first == second == dict(id='p', tracks=[1, 2, 3])
+		assert len(session.calls) == 2
+		assert 'If-None-Match' not in session.calls[0]['headers']
+		assert session.calls[1]['headers']['If-None-Match'] == '"v1"'
+		assert cache.revalidations == 1
+		assert cache.hits == 1
+		assert cache.misses == 1
+
+	async def test_changed_resource(self):
+		versions = iter(('"v1"', '"v2"'))
+
+		def responder(kw):
+			etag = next(versions)
+			return FakeResponse(body=dict(etag=etag), headers={'ETag': etag})
+
+		session = FakeSession(responder)
+		cache = ResponseCache()
+		http = await make_http(session, cache=cache)
+
+		assert await http.request(Route('GET', 'playlists/p')) == dict(etag='"v1"')
+		assert await http.request(Route('GET', 'playlists/p')) == dict(etag='"v2"')
+		assert cache.revalidations == 0
+
+	async def test_no_etag_no_storage(self):
+		session = FakeSession(lambda kw: FakeResponse(body=dict(id='p')))
+		cache = ResponseCache()
+		http = await make_http(session, cache=cache)
+
+		await http.request(Route('GET', 'playlists/p'))
+		assert len(cache) == 0
+
+
+class TestDecoding:
+	async def test_decoders(self):
+		body = b'{"id": "a", "items": [1, 2, 3]}'
+
+		for decoder in (stdlib_decoder, orjson_decoder, msgspec_decoder):
+			if decoder is None:
+				continue
+
+			assert decoder(body) == dict(id='a', items=[1, 2, 3])
+
+			with raises(ValueError):
+				decoder(b'{not json')
+
+		assert default_decoder() in (stdlib_decoder, orjson_decoder, msgspec_decoder)
+
+	async def test_custom_decoder(self):
+		decoded = []
+
+		def decoder(body):
+			decoded.append(body)
+			return stdlib_decoder(body)
+
+		http = await make_http(FakeSession(), decoder=decoder)
+
+		assert await http.request(Route('GET', 'tracks/a')) == dict(ok=True)
+		assert decoded == [b'{"ok": true}']
+
+	async def test_empty_and_invalid_bodies(self):
+		http = await make_http(FakeSession())
+
+		assert await http.decode(b'') is None
+		assert await http.decode(b'<html>') is None
+
+
+class TestOffloading:
+	async def test_large_responses_are_offloaded(self):
+		session = FakeSession(lambda kw: FakeResponse(body=dict(items=list(range(1000)))))
+
+		with ThreadPoolExecutor(1) as executor:
+			http = await make_http(session, executor=executor, offload_threshold=100)
+			threads = []
+
+			def build(data):
+				threads.append(threading.current_thread())
+				return len(data['items'])
+
+			assert await http.request(Route('GET', 'tracks/a'), build=build) == 1000
+
+		assert http.offloader.offloaded == 2
+		assert threads[0] is not threading.main_thread()
+
+	async def test_small_responses_stay_on_the_loop(self):
+		session = FakeSession(lambda kw: FakeResponse(body=dict(id='a')))
+
+		with ThreadPoolExecutor(1) as executor:
+			http = await make_http(session, executor=executor, offload_threshold=1024)
+			assert await http.request(Route('GET', 'tracks/a'), build=lambda data: data['id']) == 'a'
+
+		assert http.offloader.offloaded == 0
+
+	async def test_process_pool_only_decodes(self):
+		offloader = Offloader(ProcessPoolExecutor(1), threshold=0)
+		assert not offloader.builds_models
+		offloader.executor.shutdown()
+
+	async def test_lag_monitor(self):
+		monitor = LagMonitor(limit=0.01)
+
+		with monitor.measure('Sleeping'):
+			time.sleep(0.02)
+
+		with monitor.measure('Nothing'):
+			pass
+
+		assert monitor.blocked == 1
+		assert monitor.max_lag >= 0.02
+		assert monitor.total_lag == monitor.max_lag
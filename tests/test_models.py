@@ -0,0 +1,239 @@
+from copy import deepcopy
+from types import SimpleNamespace
+
+from pytest import mark, raises
+
+from asyncspotify import (
+	AudioAnalysis, FullAlbum, FullPlaylist, FullTrack, Image, PlaylistTrack, ResponseCache, SimpleAlbum, SimpleArtist
+)
+
+import payloads
+from fakes import PlaylistServer
+
+pytestmark = mark.asyncio
+
+client = SimpleNamespace(prefetch=0, parallel_paging=False)
+
+
+class TestPartialPayloads:
+	async def test_full_payloads(self):
+		track = FullTrack(client, payloads.full_track())
+
+		assert track.album is not None
+		assert track.duration is not None
+		assert len(track.available_markets) == len(payloads.MARKETS)
+
+	async def test_projected_playlist_track(self):
+		data = dict(track=dict(id='x', name='Track', external_ids=dict(isrc='USX')))
+		track = PlaylistTrack(client, data)
+
+		assert track.id == 'x'
+		assert track.external_ids == dict(isrc='USX')
+		assert track.album is None and track.duration is None and track.added_at is None
+		assert track.artists == [] and track.link is None
+
+	async def test_projected_playlist(self):
+		data = dict(id='p', name='Playlist', tracks=dict(items=[dict(track=dict(id='x'))]))
+		playlist = FullPlaylist(client, data)
+
+		assert playlist.owner is None and playlist.follower_count is None
+		assert [track.id for track in playlist.tracks] == ['x']
+
+	async def test_playlist_without_tracks(self):
+		playlist = FullPlaylist(client, dict(id='p', name='Playlist'))
+
+		assert playlist.tracks == [] and playlist.track_count is None
+		assert not playlist.is_filled()
+
+		with raises(ValueError):
+			playlist.track_pager()
+
+	async def test_track_without_markets(self):
+		track = FullTrack(client, dict(id='x'))
+
+		assert track.available_markets is None
+		assert not track.avaliable_in('SE')
+
+	async def test_album_without_release_date(self):
+		album = FullAlbum(client, dict(id='a', release_date_precision='day'))
+
+		assert album.release_date is None
+
+
+class TestCompactModels:
+	async def test_no_instance_dict(self):
+		models = (
+			FullTrack(client, payloads.full_track()),
+			PlaylistTrack(client, payloads.playlist_track()),
+			FullAlbum(client, payloads.full_album()),
+			FullPlaylist(client, dict(id='p', tracks=dict(total=0, items=[]))),
+			SimpleArtist(client, payloads.simple_artist()),
+			Image(payloads.image(64)),
+		)
+
+		for model in models:
+			assert not hasattr(model, '__dict__'), type(model).__name__
+
+	async def test_markets_are_shared(self):
+		first = FullTrack(client, payloads.full_track())
+		second = FullTrack(client, payloads.full_track())
+
+		assert first.available_markets is second.available_markets
+		assert first.album.available_markets is first.available_markets
+		assert first.avaliable_in(payloads.MARKETS[0])
+
+	async def test_mixin_state_is_slotted(self):
+		album = FullAlbum(client, payloads.full_album(tracks=3))
+
+		assert album.track_count == 3 and album.is_filled()
+		assert album.link == album.external_urls['spotify']
+
+
+class TestLazyModels:
+	lazy_client = SimpleNamespace(prefetch=0, parallel_paging=False, lazy=True)
+
+	async def test_same_attributes(self):
+		data = payloads.playlist_track()
+		eager = PlaylistTrack(client, data)
+		lazy = PlaylistTrack(self.lazy_client, data)
+
+		assert eager._data is None and lazy._data is not None
+
+		for name in ('added_at', 'duration', 'album', 'artists', 'popularity', 'link'):
+			assert getattr(lazy, name) == getattr(eager, name), name
+
+		assert lazy.album.release_date == eager.album.release_date
+		assert [image.url for image in lazy.album.images] == [image.url for image in eager.album.images]
+
+	async def test_decoded_once(self):
+		track = FullTrack(self.lazy_client, payloads.full_track())
+		album = track.album
+
+		assert isinstance(album, SimpleAlbum)
+		assert track.album is album
+
+	async def test_assign_before_read(self):
+		track = FullTrack(self.lazy_client, payloads.full_track())
+		track.artists = []
+
+		assert track.artists == []
+
+
+class TestTrackMixin:
+	def playlist(self, client, server, loaded):
+		tracks = dict(total=len(server.items), items=server.items[:loaded])
+		return FullPlaylist(client, dict(id='p', snapshot_id=server.snapshot_id, tracks=tracks))
+
+	async def test_fill_reuses_first_page(self, make_client):
+		server = PlaylistServer(250)
+		playlist = self.playlist(await make_client(server), server, 100)
+
+		await playlist.fill()
+
+		assert server.requested == [(100, 100), (200, 50)]
+		assert [track.id for track in playlist.tracks] == [str(n) for n in range(250)]
+		assert playlist.is_filled()
+
+	async def test_fill_refreshes_changed_playlist(self, make_client):
+		server = PlaylistServer(150)
+		playlist = self.playlist(await make_client(server), server, 100)
+
+		del server.items[0]
+		server.items.append(server.item(150))
+		await playlist.fill()
+
+		assert server.requested == [(0, 100), (100, 50)]
+		assert [track.id for track in playlist.tracks] == [str(n) for n in range(1, 151)]
+		assert playlist.snapshot_id == server.snapshot_id
+
+	async def test_iter_tracks_keeps_outdated_cache(self, make_client):
+		server = PlaylistServer(150)
+		playlist = self.playlist(await make_client(server), server, 100)
+		snapshot_id, cached = playlist.snapshot_id, playlist.tracks
+
+		del server.items[0]
+		ids = [track.id async for track in playlist.iter_tracks()]
+
+		assert ids == [str(n) for n in range(1, 150)]
+		assert playlist.tracks is cached and len(cached) == 100
+		assert playlist.snapshot_id == snapshot_id
+
+
+class TestSharedPayloads:
+	async def test_payload_is_not_modified(self):
+		data = payloads.playlist_track()
+		before = deepcopy(data)
+
+		first = PlaylistTrack(client, data)
+		second = PlaylistTrack(client, data)
+
+		assert data == before
+		assert first.album.release_date == second.album.release_date
+
+	async def test_changes_stay_in_their_model(self):
+		data = payloads.playlist_track()
+		album = payloads.full_album(tracks=0)
+		before = deepcopy((data, album))
+
+		track = PlaylistTrack(client, data)
+		track.added_by['id'] = 'HACK'
+
+		with raises(TypeError):
+			track.external_ids['isrc'] = 'HACK'
+
+		with raises(TypeError):
+			track.external_urls['spotify'] = 'HACK'
+
+		full_album = FullAlbum(client, album)
+		full_album.genres.append('HACK')
+		full_album.copyrights[0]['text'] = 'HACK'
+
+		assert (data, album) == before
+
+		with raises(TypeError):
+			PlaylistTrack(TestLazyModels.lazy_client, data)._data['added_at'] = 'HACK'
+
+	async def test_audio_analysis_is_not_shared(self):
+		data = payloads.audio_analysis(segments=2)
+		before = deepcopy(data)
+
+		analysis = AudioAnalysis(client, data)
+
+		with raises(TypeError):
+			analysis.segments[0].pitches[0] = 'HACK'
+
+		assert analysis.track.codestring == data['track']['codestring']
+		assert data == before
+
+	async def test_cached_response_is_not_changed(self, make_client, catalog_server):
+		data = payloads.full_track()
+		catalog_server.make = lambda type, id: data
+		client = await make_client(catalog_server, cache=ResponseCache())
+
+		first = await client.get_track('t')
+		first.artists[0].name = 'HACK'
+
+		with raises(TypeError):
+			first.external_ids['isrc'] = 'HACK'
+
+		second = await client.get_track('t')
+
+		assert len(catalog_server.requested) == 1
+		assert second.external_ids == data['external_ids']
+		assert second.artists[0].name == data['artists'][0]['name']
+
+	async def test_freeze(self):
+		album = FullAlbum(TestLazyModels.lazy_client, payloads.full_album(tracks=3)).freeze()
+
+		assert album.frozen and isinstance(album, FullAlbum)
+		assert isinstance(album.tracks, tuple) and all(track.frozen for track in album.tracks)
+		assert album.images[0].frozen and album.artists[0].frozen
+		assert album._data is None
+
+		with raises(AttributeError):
+			album.name = 'other'
+
+		with raises(TypeError):
+			album.external_urls['spotify'] = 'other'
+
+		assert {album, album.freeze()} == {album}
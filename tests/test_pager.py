@@ -0,0 +1,378 @@
+import asyncio
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from pytest import mark, raises
+
+from asyncspotify.offload import Offloader
+from asyncspotify.pager import CursorBasedPaging, Pager, SearchPager, first_page_limit, page_limit, plan_pages
+
+from fakes import PlaylistServer
+
+pytestmark = mark.asyncio
+
+URL = 'https://api.spotify.com/v1/playlists/p/tracks'
+
+
+def page(offset, limit, total, wrap=None):
+	end = min(offset + limit, total)
+	obj = dict(
+		href='{0}?offset={1}&limit={2}'.format(URL, offset, limit),
+		items=[dict(n=n) for n in range(offset, end)],
+		limit=limit,
+		offset=offset,
+		total=total,
+		next='{0}?offset={1}&limit={2}'.format(URL, end, limit) if end < total else None,
+		previous=None,
+	)
+	return obj if wrap is None else {wrap: obj}
+
+
+class FakeHTTP:
+	'''Serves offset based pages of ``total`` items and records the requests made.'''
+
+	def __init__(self, total, delay=0.0, wrap=None):
+		self.total = total
+		self.delay = delay
+		self.wrap = wrap
+		self.requested = []
+		self.limits = []
+		self.in_flight = 0
+		self.max_in_flight = 0
+		self.offloader = Offloader()
+
+	async def request(self, route, build=None):
+		data = await self.serve(route)
+		return data if build is None else await self.offloader.build(build, data, 0)
+
+	async def serve(self, route):
+		query = parse_qs(urlsplit(route.url).query)
+		offset = int(query['offset'][0])
+		limit = int(query['limit'][0])
+
+		self.requested.append(offset)
+		self.limits.append(limit)
+		self.in_flight += 1
+		self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+		try:
+			await asyncio.sleep(self.delay)
+		finally:
+			self.in_flight -= 1
+
+		return page(offset, limit, self.total, self.wrap)
+
+
+class TestPager:
+	async def test_iterates_everything(self):
+		http = FakeHTTP(250)
+		items = [item['n'] async for item in Pager(http, page(0, 100, 250))]
+
+		assert items == list(range(250))
+		assert http.requested == [100, 200]
+
+	async def test_limit(self):
+		http = FakeHTTP(250)
+		items = [item['n'] async for item in Pager(http, page(0, 100, 250), limit=150)]
+
+		assert items == list(range(150))
+		assert http.requested == [100]
+
+	async def test_prefetch(self):
+		http = FakeHTTP(500, delay=0.01)
+		pager = Pager(http, page(0, 100, 500), prefetch=2)
+		seen = []
+
+		async for item in pager:
+			if item['n'] == 0:
+				# give read ahead a chance to run while the first page is consumed
+				await asyncio.sleep(0.05)
+				assert http.requested == [100, 200]
+			seen.append(item['n'])
+
+		assert seen == list(range(500))
+		assert http.requested == [100, 200, 300, 400]
+
+	async def test_prefetch_respects_limit(self):
+		http = FakeHTTP(1000, delay=0.01)
+		items = [item async for item in Pager(http, page(0, 100, 1000), limit=150, prefetch=5)]
+
+		assert len(items) == 150
+		assert http.requested == [100]
+
+	async def test_close_cancels_read_ahead(self):
+		http = FakeHTTP(1000, delay=0.05)
+
+		async with Pager(http, page(0, 100, 1000), prefetch=3) as pager:
+			async for item in pager:
+				break
+
+			tasks = list(pager._ahead)
+
+		await asyncio.sleep(0)
+		assert tasks and all(task.cancelled() for task in tasks)
+
+	async def test_parallel(self):
+		http = FakeHTTP(1000, delay=0.02)
+		items = [item['n'] async for item in Pager(http, page(0, 100, 1000), parallel=True)]
+
+		assert items == list(range(1000))
+		assert sorted(http.requested) == list(range(100, 1000, 100))
+		assert http.max_in_flight == 9
+
+	async def test_parallel_from_empty_page(self):
+		http = FakeHTTP(1000, delay=0.02)
+		empty = dict(page(300, 100, 1000), items=[])
+		items = [item['n'] async for item in Pager(http, empty, parallel=True)]
+
+		assert items == list(range(300, 1000))
+		assert http.max_in_flight == 7
+
+	async def test_parallel_does_not_over_fetch(self):
+		http = FakeHTTP(1000)
+		pager = Pager(http, page(0, 100, 1000), limit=250, parallel=True)
+		items = [item['n'] async for item in pager]
+
+		assert items == list(range(250))
+		assert http.requested == [100, 200]
+		assert pager.limit == 50
+
+	async def test_parallel_is_ignored_by_cursors(self):
+		assert not CursorBasedPaging(FakeHTTP(0), dict(artists=dict(page(0, 50, 0), cursors={})), 'artists', parallel=True).parallel
+
+	async def test_search_pager(self):
+		http = FakeHTTP(120, wrap='tracks')
+		items = [item['n'] async for item in SearchPager(http, page(0, 50, 120, 'tracks'), 'tracks', prefetch=1)]
+
+		assert items == list(range(120))
+
+	async def test_cursor_based_paging(self):
+		def cursor_page(offset, limit, total):
+			obj = page(offset, limit, total)
+			del obj['offset']
+			obj['cursors'] = dict(after=str(offset + limit))
+			return dict(artists=obj)
+
+		class CursorHTTP(FakeHTTP):
+			async def serve(self, route):
+				data = await super().serve(route)
+				del data['artists']['offset']
+				data['artists']['cursors'] = dict(after='x')
+				return data
+
+		http = CursorHTTP(120, wrap='artists')
+		pager = CursorBasedPaging(http, cursor_page(0, 50, 120), 'artists', prefetch=1)
+		items = [item['n'] async for item in pager]
+
+		assert items == list(range(120))
+		assert pager.cursors == dict(after='x')
+
+	@mark.parametrize('prefetch', [0, 2])
+	async def test_cursor_based_limit(self, prefetch):
+		class CursorHTTP(FakeHTTP):
+			async def serve(self, route):
+				data = await super().serve(route)
+				data['artists']['cursors'] = dict(after='x')
+				return data
+
+		first = page(0, 50, 1000, 'artists')
+		first['artists']['cursors'] = dict(after='x')
+
+		http = CursorHTTP(1000, wrap='artists')
+		items = [item['n'] async for item in CursorBasedPaging(http, first, 'artists', limit=260, prefetch=prefetch)]
+
+		assert items == list(range(260))
+		assert http.limits == [100, 100, 10]
+
+	async def test_pages(self):
+		http = FakeHTTP(250)
+		pages = [[item['n'] for item in batch] async for batch in Pager(http, page(0, 100, 250)).pages()]
+
+		assert pages == [list(range(0, 100)), list(range(100, 200)), list(range(200, 250))]
+
+	async def test_pages_respects_limit_and_position(self):
+		http = FakeHTTP(250)
+		pager = Pager(http, page(0, 100, 250), limit=220)
+
+		first = await pager.__anext__()
+		pages = [[item['n'] for item in batch] async for batch in pager.iter_batches()]
+
+		assert first['n'] == 0
+		assert pages == [list(range(1, 100)), list(range(100, 200)), list(range(200, 220))]
+
+	async def test_build(self):
+		http = FakeHTTP(150)
+		pager = Pager(http, page(0, 100, 150), parallel=True, build=lambda items: [item['n'] * 2 for item in items])
+		pages = [batch async for batch in pager.pages()]
+
+		assert [len(batch) for batch in pages] == [100, 50]
+		assert pages[1][-1] == 298
+
+	async def test_builds_are_measured(self):
+		http = FakeHTTP(250)
+		http.offloader = Offloader(lag_limit=0)
+		pager = Pager(http, page(0, 100, 250), prefetch=1, build=lambda items: [item['n'] for item in items])
+
+		assert [item async for item in pager] == list(range(250))
+		assert http.offloader.lag.blocked == 3
+
+	async def test_starting_offset(self):
+		http = FakeHTTP(250)
+		items = [item['n'] async for item in Pager(http, page(40, 100, 250), limit=120)]
+
+		assert items == list(range(40, 160))
+		assert http.requested == [140]
+
+
+class TestPlanner:
+	async def test_page_limit(self):
+		assert page_limit('playlists/abc/tracks') == 100
+		assert page_limit('albums/abc/tracks') == 50
+		assert page_limit('search') == 50
+		assert page_limit('some/new/endpoint') == 20
+
+	async def test_first_page_limit(self):
+		assert first_page_limit('playlists/abc/tracks') == 100
+		assert first_page_limit('playlists/abc/tracks', 30) == 30
+		assert first_page_limit('albums/abc/tracks', 120) == 50
+		assert first_page_limit('albums/abc/tracks', 0) == 1
+
+	async def test_plan_pages(self):
+		assert plan_pages(0, 250, 100) == [(0, 100), (100, 100), (200, 50)]
+		assert plan_pages(40, 60, 50) == [(40, 50), (90, 10)]
+		assert plan_pages(10, 0, 50) == []
+
+	async def test_following_pages_use_the_largest_size(self):
+		http = FakeHTTP(1000)
+		items = [item async for item in Pager(http, page(0, 20, 1000), limit=330)]
+
+		assert len(items) == 330
+		assert http.requested == [20, 120, 220, 320]
+		assert http.limits == [100, 100, 100, 10]
+
+
+class TestRandomAccess:
+	async def test_get(self):
+		http = FakeHTTP(10000)
+		pager = Pager(http, page(0, 100, 10000))
+
+		assert (await pager.get(5050))['n'] == 5050
+		assert (await pager.get(-1))['n'] == 9999
+		assert (await pager.get(10))['n'] == 10
+		assert http.requested == [5050, 9999]
+
+	async def test_get_out_of_range(self):
+		pager = Pager(FakeHTTP(100), page(0, 50, 100))
+
+		with raises(IndexError):
+			await pager.get(100)
+
+	async def test_slice(self):
+		http = FakeHTTP(10000)
+		pager = Pager(http, page(0, 100, 10000))
+		items = await pager[5000:5250]
+
+		assert [item['n'] for item in items] == list(range(5000, 5250))
+		assert sorted(http.requested) == [5000, 5100, 5200]
+
+	async def test_slice_relative_to_start(self):
+		http = FakeHTTP(1000)
+		pager = Pager(http, page(200, 100, 1000), limit=300)
+
+		assert len(pager) == 300
+		assert [item['n'] for item in await pager[-3::2]] == [497, 499]
+
+	async def test_slice_builds_items(self):
+		pager = Pager(FakeHTTP(1000), page(0, 100, 1000), build=lambda items: [item['n'] for item in items])
+
+		assert await pager[150:153] == [150, 151, 152]
+
+	async def test_cursors_raise(self):
+		pager = CursorBasedPaging(FakeHTTP(0), dict(artists=dict(page(0, 50, 100), cursors={})), 'artists')
+
+		with raises(TypeError):
+			await pager.get(60)
+
+
+class TestCheckpoints:
+	async def test_resume(self):
+		http = FakeHTTP(1000)
+		pager = Pager(http, page(0, 100, 1000), limit=900)
+
+		seen = [(await pager.__anext__())['n'] for _ in range(250)]
+		checkpoint = json.loads(json.dumps(pager.checkpoint()))
+
+		http = FakeHTTP(1000)
+		resumed = await Pager.resume(http, checkpoint, prefetch=1)
+		seen += [item['n'] async for item in resumed]
+
+		assert seen == list(range(900))
+		assert http.requested[0] == 250
+		assert len(resumed) == 900
+
+	async def test_resume_finished(self):
+		pager = Pager(FakeHTTP(50), page(0, 50, 50))
+		assert len([item async for item in pager]) == 50
+
+		http = FakeHTTP(50)
+		resumed = await Pager.resume(http, pager.checkpoint())
+
+		assert [item async for item in resumed] == []
+		assert http.requested == []
+
+	async def test_resume_cursors(self):
+		artists = [dict(n=n) for n in range(120)]
+
+		def cursor_page(after, limit=50):
+			items = artists[after:after + limit]
+			end = after + len(items)
+			url = '{0}?after={1}&limit={2}'.format(URL, after, limit)
+			return dict(artists=dict(
+				href=url, items=items, limit=limit, total=len(artists), previous=None, cursors=dict(after=str(end)),
+				next='{0}?after={1}&limit={2}'.format(URL, end, limit) if end < len(artists) else None,
+			))
+
+		class CursorHTTP(FakeHTTP):
+			def __init__(self):
+				super().__init__(len(artists))
+
+			async def serve(self, route):
+				after = int(parse_qs(urlsplit(route.url).query)['after'][0])
+				self.requested.append(after)
+				return cursor_page(after)
+
+		pager = CursorBasedPaging(CursorHTTP(), cursor_page(0), 'artists')
+		seen = [(await pager.__anext__())['n'] for _ in range(70)]
+
+		http = CursorHTTP()
+		resumed = await CursorBasedPaging.resume(http, json.loads(json.dumps(pager.checkpoint())))
+		seen += [item['n'] async for item in resumed]
+
+		assert seen == list(range(120))
+		assert http.requested == [50, 100]
+
+	async def test_params_are_kept(self):
+		http = FakeHTTP(250)
+		pager = Pager(http, page(0, 100, 250), params=dict(market='SE'))
+		urls = []
+		http.serve = lambda route, serve=http.serve: urls.append(route.url) or serve(route)
+
+		assert len([item async for item in pager]) == 250
+		assert all('market=SE' in url for url in urls)
+		assert pager.checkpoint()['params'] == dict(market='SE')
+
+
+class TestStreaming:
+	@mark.parametrize('prefetch', [0, 1, 2])
+	async def test_pages_are_fetched_as_needed(self, make_client, prefetch):
+		server = PlaylistServer(450)
+		client = await make_client(server, prefetch=prefetch, parallel_paging=True)
+		ids = []
+
+		async for track in client.iter_playlist_tracks('p'):
+			# the page holding this track, and at most prefetch pages after it
+			assert len(server.requested) <= len(ids) // 100 + 1 + prefetch
+			ids.append(track.id)
+
+		assert ids == [str(n) for n in range(450)]
+		assert [offset for offset, limit in server.requested] == [0, 100, 200, 300, 400]
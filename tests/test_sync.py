@@ -0,0 +1,72 @@
+from pytest import mark
+
+from asyncspotify import JSONPlaylistStorage, PlaylistState
+
+from fakes import PlaylistServer
+
+pytestmark = mark.asyncio
+
+
+class TestSync:
+	async def test_first_sync(self, make_client):
+		server = PlaylistServer(250)
+		client = await make_client(server)
+
+		state = await client.sync_playlist('p')
+
+		assert state.changed and state.fetched == 250
+		assert state.items == server.items
+		assert sorted(server.requested) == [(0, 100), (100, 100), (200, 50)]
+
+	async def test_unchanged(self, make_client):
+		server = PlaylistServer(250)
+		client = await make_client(server)
+		state = await client.sync_playlist('p')
+		server.requested.clear()
+
+		state = await client.sync_playlist('p', state)
+
+		assert not state.changed and state.fetched == 0
+		assert server.requested == []
+
+	async def test_appended(self, make_client):
+		server = PlaylistServer(250)
+		client = await make_client(server)
+		state = await client.sync_playlist('p')
+
+		server.items += [server.item(n) for n in range(250, 260)]
+		server.requested.clear()
+		state = await client.sync_playlist('p', state)
+
+		assert state.changed and state.fetched == 11
+		assert state.items == server.items
+		assert server.requested == [(249, 11)]
+
+	async def test_not_only_appended(self, make_client):
+		server = PlaylistServer(250)
+		client = await make_client(server)
+		state = await client.sync_playlist('p')
+
+		del server.items[10]
+		server.items += [server.item(n) for n in range(250, 260)]
+		state = await client.sync_playlist('p', state)
+
+		assert state.items == server.items
+
+	async def test_storage(self, make_client, tmp_path):
+		server = PlaylistServer(30)
+		client = await make_client(server)
+		storage = JSONPlaylistStorage(str(tmp_path))
+
+		await client.sync_playlist('p', storage=storage)
+		stored = await storage.load('p')
+
+		assert isinstance(stored, PlaylistState)
+		assert stored.snapshot_id == server.snapshot_id
+		assert stored.items == server.items
+
+		server.items += [server.item(n) for n in range(30, 40)]
+		await client.sync_playlist('p', storage=storage)
+
+		assert len((await storage.load('p')).items) == 40
+		assert [path.name for path in tmp_path.iterdir()] == ['p.json']